@@ -29,7 +29,7 @@ from .protocol.types import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeploymentConfig:
     """Configuration for agent deployment and network exposure.
 
@@ -10,11 +10,12 @@
 
 """bindufy decorator for transforming regular agents into secure, networked agents."""
 
+import hashlib
 import inspect
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict
-from urllib.parse import urlparse
 from uuid import UUID
 
 from bindu.common.models import (
@@ -38,9 +39,7 @@ from bindu.utils.config import (
     update_auth_settings,
     update_vault_settings,
 )
-from bindu.utils.display import prepare_server_display
 from bindu.utils.logging import get_logger
-from bindu.utils.server_runner import run_server as start_uvicorn_server
 from bindu.utils.skills import load_skills
 
 # Configure logging for the module
@@ -53,6 +52,9 @@ DEFAULT_NETWORK = "base-sepolia"
 # Default protocol version
 DEFAULT_PROTOCOL_VERSION = "1.0.0"
 
+# Deployment fields without a default in DeploymentConfig
+_REQUIRED_DEPLOYMENT_FIELDS = ("url", "expose")
+
 
 def _generate_agent_id(validated_config: Dict[str, Any]) -> UUID:
     """Generate deterministic agent ID from author + name.
@@ -63,18 +65,33 @@ def _generate_agent_id(validated_config: Dict[str, Any]) -> UUID:
     Returns:
         UUID: Deterministic agent ID
     """
-    import hashlib
-
     author = validated_config.get("author", "")
     agent_name = validated_config.get("name", "")
 
+    agent_id = _derive_agent_id(str(author), str(agent_name))
+    logger.info(f"Generated deterministic agent_id from author+name: {agent_id}")
+    return agent_id
+
+
+@lru_cache(maxsize=128)
+def _derive_agent_id(author: str, agent_name: str) -> UUID:
+    """Derive the content-addressed agent ID for an author + name pair.
+
+    The ID is stable across restarts, so it must not change format: DID keys
+    and Hydra registrations are stored under it.
+
+    Args:
+        author: Agent author
+        agent_name: Agent name
+
+    Returns:
+        UUID: Deterministic agent ID
+    """
     # Create deterministic ID from author + agent_name
     deterministic_string = f"{author}:{agent_name}"
     agent_id_hex = hashlib.sha256(deterministic_string.encode()).hexdigest()[:32]
     # Convert to UUID for type compatibility
-    agent_id = UUID(agent_id_hex)
-    logger.info(f"Generated deterministic agent_id from author+name: {agent_id}")
-    return agent_id
+    return UUID(agent_id_hex)
 
 
 def _normalize_execution_costs(execution_cost: Any) -> list[dict[str, Any]]:
@@ -287,6 +304,18 @@ def _create_telemetry_config(validated_config: Dict[str, Any]) -> TelemetryConfi
     )
 
 
+@lru_cache(maxsize=1)
+def _default_host_port() -> tuple[str, int]:
+    """Get the default server host and port from network settings.
+
+    The network settings are fixed once loaded, so they are read only once.
+
+    Returns:
+        Tuple of (host, port)
+    """
+    return app_settings.network.default_host, app_settings.network.default_port
+
+
 def _parse_deployment_url(
     deployment_config: DeploymentConfig | None,
 ) -> tuple[str, int]:
@@ -298,14 +327,43 @@ def _parse_deployment_url(
     Returns:
         Tuple of (host, port)
     """
+    default_host, default_port = _default_host_port()
+
     if not deployment_config:
-        return app_settings.network.default_host, app_settings.network.default_port
+        return default_host, default_port
+
+    # Only host and port are needed, so scan the authority directly instead of
+    # building a full urllib ParseResult
+    _, sep, rest = deployment_config.url.partition("://")
+    if not sep:
+        return default_host, default_port
+
+    end = len(rest)
+    for delimiter in "/?#":
+        index = rest.find(delimiter, 0, end)
+        if index != -1:
+            end = index
+    authority = rest[:end].rpartition("@")[2]
+
+    if authority.startswith("["):
+        # IPv6 literal, e.g. [::1]:8080
+        close = authority.find("]")
+        host = authority[1:close] if close != -1 else ""
+        port_str = authority[close + 2 :] if close != -1 else ""
+    else:
+        host, _, port_str = authority.partition(":")
 
-    parsed_url = urlparse(deployment_config.url)
-    host = parsed_url.hostname or app_settings.network.default_host
-    port = parsed_url.port or app_settings.network.default_port
+    # Same validation as urlparse().port: ASCII digits only (isdigit() alone
+    # accepts e.g. superscripts, which int() rejects) and within 0-65535
+    port = 0
+    if port_str:
+        if not (port_str.isascii() and port_str.isdecimal()):
+            raise ValueError(f"Port could not be cast to integer value as {port_str!r}")
+        port = int(port_str)
+        if port > 65535:
+            raise ValueError("Port out of range 0-65535")
 
-    return host, port
+    return host.lower() or default_host, port or default_port
 
 
 def _create_deployment_config(
@@ -323,21 +381,18 @@ def _create_deployment_config(
     if not deploy_dict:
         return None
 
-    missing = []
-
-    if "url" not in deploy_dict:
-        missing.append("deployment.url")
-
-    if "expose" not in deploy_dict:
-        missing.append("deployment.expose")
-
+    missing = [
+        f"deployment.{field}"
+        for field in _REQUIRED_DEPLOYMENT_FIELDS
+        if field not in deploy_dict
+    ]
     if missing:
         raise ValueError(f"Missing required config field(s): {', '.join(missing)}")
 
     return DeploymentConfig(
         url=deploy_dict["url"],
         expose=deploy_dict["expose"],
-        protocol_version=deploy_dict.get("protocol_version", "1.0.0"),
+        protocol_version=deploy_dict.get("protocol_version", DEFAULT_PROTOCOL_VERSION),
         proxy_urls=deploy_dict.get("proxy_urls"),
         cors_origins=deploy_dict.get("cors_origins"),
         openapi_schema=deploy_dict.get("openapi_schema"),
@@ -572,6 +627,10 @@ def _bindufy_core(
 
     # Start server if requested
     if run_server:
+        # Deferred so importing bindufy does not pull in uvicorn and rich
+        from bindu.utils.display import prepare_server_display
+        from bindu.utils.server_runner import run_server as start_uvicorn_server
+
         # Display server startup banner
         prepare_server_display(
             host=host,
@@ -19,6 +19,7 @@ import inspect
 from datetime import UTC, datetime
 from typing import Any, Callable, Literal
 from uuid import UUID
+from weakref import WeakSet
 
 from bindu.common.models import AgentManifest
 from bindu.extensions.did import DIDAgentExtension
@@ -34,6 +35,10 @@ logger = get_logger("bindu.penguin.manifest")
 # Required parameter name for agent functions
 REQUIRED_PARAM_NAME = "messages"
 
+# Agent functions that already passed validate_agent_function. Weak so the
+# cache never keeps a handler alive after its agent is gone.
+_validated_agent_functions: WeakSet[Callable] = WeakSet()
+
 
 def _create_default_agent_trust() -> AgentTrust:
     """Create a default AgentTrust configuration with minimal required fields.
@@ -82,6 +87,14 @@ def validate_agent_function(agent_function: Callable) -> None:
     Raises:
         ValueError: If function signature is invalid
     """
+    # Skip inspect.signature for handlers already validated (e.g. hot reload)
+    try:
+        if agent_function in _validated_agent_functions:
+            return
+    except TypeError:
+        # Unhashable callable; it can never be cached
+        pass
+
     func_name = getattr(agent_function, "__name__", "<unknown>")
     logger.debug(f"Validating agent function: {func_name}")
 
@@ -102,6 +115,12 @@ def validate_agent_function(agent_function: Callable) -> None:
             f"First parameter must be named '{REQUIRED_PARAM_NAME}', got '{params[0].name}'"
         )
 
+    try:
+        _validated_agent_functions.add(agent_function)
+    except TypeError:
+        # Not weak-referenceable or hashable; validate again next time
+        pass
+
     logger.debug(f"Agent function '{func_name}' validated successfully")
 
 
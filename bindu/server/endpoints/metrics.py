@@ -72,12 +72,12 @@ async def metrics_endpoint(app: BinduApplication, request: Request) -> Response:
     # Update agent metrics from current state
     await _update_agent_metrics(app)
 
-    # Get metrics instance and generate Prometheus text
+    # Get metrics instance and generate Prometheus text as the encoded body
     metrics = get_metrics()
-    prometheus_text = metrics.generate_prometheus_text()
+    prometheus_body = metrics.generate_prometheus_bytes()
 
     return Response(
-        content=prometheus_text,
+        content=prometheus_body,
         media_type="text/plain; version=0.0.4; charset=utf-8",
         headers=NO_CACHE_HEADERS,
     )
@@ -5,14 +5,103 @@ This module provides metrics collection for HTTP requests, latency, and agent ta
 
 from __future__ import annotations
 
-from collections import defaultdict
-from threading import Lock
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from itertools import accumulate
+from threading import Lock, local
 
 from bindu.utils.logging import get_logger
 
 logger = get_logger("bindu.server.metrics")
 
 
+def _metric_header(metric_name: str, help_text: str, metric_type: str) -> str:
+    """Render the Prometheus HELP and TYPE lines for a metric.
+
+    Args:
+        metric_name: Name of the metric
+        help_text: Help text describing the metric
+        metric_type: Prometheus metric type (counter, gauge, histogram, summary)
+
+    Returns:
+        The two header lines joined by a newline
+    """
+    return f"# HELP {metric_name} {help_text}\n# TYPE {metric_name} {metric_type}"
+
+
+# Metric headers are static, so they are rendered once at import time
+_HTTP_REQUESTS_TOTAL_HEADER = _metric_header(
+    "http_requests_total", "Total number of HTTP requests", "counter"
+)
+_HTTP_REQUEST_DURATION_SECONDS_HEADER = _metric_header(
+    "http_request_duration_seconds", "HTTP request latency", "histogram"
+)
+_AGENT_TASKS_ACTIVE_HEADER = _metric_header(
+    "agent_tasks_active", "Currently active tasks", "gauge"
+)
+_AGENT_TASKS_COMPLETED_TOTAL_HEADER = _metric_header(
+    "agent_tasks_completed_total", "Total completed tasks", "counter"
+)
+_TASK_DURATION_SECONDS_HEADER = _metric_header(
+    "task_duration_seconds", "Task execution duration", "histogram"
+)
+_AGENT_ERRORS_TOTAL_HEADER = _metric_header(
+    "agent_errors_total", "Total errors by type", "counter"
+)
+_HTTP_REQUEST_SIZE_BYTES_HEADER = _metric_header(
+    "http_request_size_bytes", "HTTP request body size", "summary"
+)
+_HTTP_RESPONSE_SIZE_BYTES_HEADER = _metric_header(
+    "http_response_size_bytes", "HTTP response body size", "summary"
+)
+_HTTP_REQUESTS_IN_FLIGHT_HEADER = _metric_header(
+    "http_requests_in_flight",
+    "Current number of HTTP requests being processed",
+    "gauge",
+)
+
+
+class _HttpRequestShard:
+    """Per-thread HTTP request counters.
+
+    Each shard is written only by the thread that owns it, so the hot
+    recording path needs no lock. Shards are summed at scrape time.
+    """
+
+    __slots__ = (
+        "duration_count",
+        "duration_counts",
+        "duration_sum",
+        "request_size_count",
+        "request_size_sum",
+        "requests",
+        "response_size_count",
+        "response_size_sum",
+        "version",
+    )
+
+    def __init__(self, bucket_count: int):
+        """Initialize an empty shard.
+
+        Args:
+            bucket_count: Number of duration histogram buckets
+        """
+        # Request counts indexed by PrometheusMetrics label id; grown on demand
+        self.requests = array("q")
+        self.duration_counts = array("q", [0] * bucket_count)
+        self.duration_sum = 0.0
+        self.duration_count = 0
+        self.request_size_sum = 0.0
+        self.request_size_count = 0
+        self.response_size_sum = 0.0
+        self.response_size_count = 0
+        # Number of writes to this shard, see PrometheusMetrics._current_version
+        self.version = 0
+
+
 class PrometheusMetrics:
     """Prometheus metrics collector for Bindu server."""
 
@@ -20,15 +109,23 @@ class PrometheusMetrics:
         """Initialize metrics collector."""
         self._lock = Lock()
 
-        # HTTP request counters: {(method, endpoint, status): count}
-        self._http_requests: dict[tuple[str, str, str], int] = defaultdict(int)
+        # HTTP request label sets get a dense integer id on first use:
+        # {(method, endpoint, status): label_id}, and the pre-formatted label
+        # string for each id. Shards count requests in arrays indexed by id.
+        self._http_request_label_ids: dict[tuple[str, str, str], int] = {}
+        self._http_request_labels: list[str] = []
+
+        # HTTP request counters, duration histogram and sizes live in
+        # per-thread shards; see _HttpRequestShard
+        self._http_shards: list[_HttpRequestShard] = []
+        self._http_shard_local = local()
 
-        # HTTP request duration histograms: {bucket_le: count}
-        # Buckets: 0.1s, 0.5s, 1.0s, +Inf
-        self._duration_buckets = [0.1, 0.5, 1.0, float("inf")]
-        self._duration_counts: dict[float, int] = defaultdict(int)
-        self._duration_sum = 0.0
-        self._duration_total_count = 0
+        # HTTP request duration histogram buckets: 0.1s, 0.5s, 1.0s, +Inf
+        # Counts are stored per bucket and made cumulative at scrape time
+        self._duration_buckets = (0.1, 0.5, 1.0, float("inf"))
+        self._duration_bucket_labels = tuple(
+            self._format_bucket(bucket) for bucket in self._duration_buckets
+        )
 
         # Agent task gauges: {agent_id: active_count}
         self._agent_tasks_active: dict[str, int] = defaultdict(int)
@@ -36,12 +133,13 @@ class PrometheusMetrics:
         # Agent task completion counters: {(agent_id, status): count}
         self._agent_tasks_completed: dict[tuple[str, str], int] = defaultdict(int)
 
-        # Task duration histogram: {bucket_le: count}
+        # Task duration histogram: {(agent_id, status): per-bucket counts}
         # Buckets: 1s, 5s, 10s, 30s, 60s, +Inf
-        self._task_duration_buckets = [1.0, 5.0, 10.0, 30.0, 60.0, float("inf")]
-        self._task_duration_counts: dict[tuple[str, str, float], int] = defaultdict(
-            int
-        )  # (agent_id, status, bucket)
+        self._task_duration_buckets = (1.0, 5.0, 10.0, 30.0, 60.0, float("inf"))
+        self._task_duration_bucket_labels = tuple(
+            self._format_bucket(bucket) for bucket in self._task_duration_buckets
+        )
+        self._task_duration_counts: dict[tuple[str, str], array] = {}
         self._task_duration_sum: dict[tuple[str, str], float] = defaultdict(
             float
         )  # (agent_id, status)
@@ -52,13 +150,28 @@ class PrometheusMetrics:
         # Error tracking: {(agent_id, error_type): count}
         self._agent_errors: dict[tuple[str, str], int] = defaultdict(int)
 
-        # Request/Response size metrics
-        self._http_request_size_sum = 0.0
-        self._http_request_size_count = 0
-        self._http_response_size_sum = 0.0
-        self._http_response_size_count = 0
+        # Concurrent request gauge
         self._http_requests_in_flight = 0
 
+        # Write counter for the lock-protected metrics above; HTTP shards keep
+        # their own. The last scrape output is reused until either changes.
+        self._version = 0
+        self._cached_output: tuple[int, bytes] | None = None
+
+    def _get_http_shard(self) -> _HttpRequestShard:
+        """Get the HTTP request shard owned by the current thread.
+
+        Returns:
+            The calling thread's shard, created and registered on first use
+        """
+        shard = getattr(self._http_shard_local, "shard", None)
+        if shard is None:
+            shard = _HttpRequestShard(len(self._duration_buckets))
+            self._http_shard_local.shard = shard
+            with self._lock:
+                self._http_shards.append(shard)
+        return shard
+
     def record_http_request(
         self,
         method: str,
@@ -78,26 +191,138 @@ class PrometheusMetrics:
             request_size: Request body size in bytes
             response_size: Response body size in bytes
         """
+        key = (method, endpoint, status)
+        label_id = self._http_request_label_ids.get(key)
+        if label_id is None:
+            label_id = self._register_http_request_label(method, endpoint, status)
+
+        # No lock needed: the shard is only ever written by this thread
+        shard = self._get_http_shard()
+
+        # Increment request counter
+        requests = shard.requests
+        if label_id >= len(requests):
+            requests.extend([0] * (label_id + 1 - len(requests)))
+        requests[label_id] += 1
+
+        # Record duration in the smallest bucket with le >= duration. A NaN
+        # duration is not an observation: it would land in the first bucket
+        # and poison the sum, so it is left out of the histogram entirely.
+        if duration == duration:
+            shard.duration_counts[bisect_left(self._duration_buckets, duration)] += 1
+            shard.duration_sum += duration
+            shard.duration_count += 1
+
+        # Record request/response sizes
+        if request_size > 0:
+            shard.request_size_sum += request_size
+            shard.request_size_count += 1
+        if response_size > 0:
+            shard.response_size_sum += response_size
+            shard.response_size_count += 1
+
+        # Bumped last so a scrape never caches a half-applied write as current
+        shard.version += 1
+
+    def record_http_requests_batch(
+        self, rows: Sequence[tuple[str, str, str, float]]
+    ) -> None:
+        """Record many HTTP requests at once.
+
+        Bucket indices for all durations are computed in a single vectorized
+        pass and each distinct label set is looked up only once, which makes
+        this much cheaper than calling record_http_request in a loop when
+        replaying or flushing buffered requests.
+
+        Everything derived from ``rows`` is computed before the shard is
+        touched, so invalid input cannot leave a half-applied write behind.
+
+        Args:
+            rows: (method, endpoint, status, duration) tuples, with the same
+                meaning as the record_http_request arguments
+        """
+        if not rows:
+            return
+
+        # Deferred so servers that never batch do not pay the numpy import
+        import numpy as np
+
+        durations = np.fromiter(
+            (row[3] for row in rows), dtype=np.float64, count=len(rows)
+        )
+        # NaN is left out of the histogram, as in record_http_request;
+        # searchsorted would otherwise index one past the +Inf bucket
+        durations = durations[~np.isnan(durations)]
+        bucket_counts = np.bincount(
+            np.searchsorted(self._duration_buckets, durations, side="left"),
+            minlength=len(self._duration_buckets),
+        ).tolist()
+        label_counts = Counter(
+            (method, endpoint, status) for method, endpoint, status, _ in rows
+        )
+
+        # Resolve every label id up front: registering a label can still fail
+        # on bad input, and must do so before any request is counted
+        label_ids = []
+        for key, count in label_counts.items():
+            label_id = self._http_request_label_ids.get(key)
+            if label_id is None:
+                label_id = self._register_http_request_label(*key)
+            label_ids.append((label_id, count))
+
+        shard = self._get_http_shard()
+
+        requests = shard.requests
+        max_label_id = max(label_id for label_id, _ in label_ids)
+        if max_label_id >= len(requests):
+            requests.extend([0] * (max_label_id + 1 - len(requests)))
+        for label_id, count in label_ids:
+            requests[label_id] += count
+
+        for i, count in enumerate(bucket_counts):
+            shard.duration_counts[i] += count
+
+        shard.duration_sum += float(durations.sum())
+        shard.duration_count += len(durations)
+
+        # Bumped last so a scrape never caches a half-applied write as current
+        shard.version += 1
+
+    def _register_http_request_label(
+        self, method: str, endpoint: str, status: str
+    ) -> int:
+        """Assign an id to an HTTP request label set and cache its label string.
+
+        Label components are interned when first seen so every cached key and
+        label shares a single copy of each string. Interned strings live for
+        the life of the process, so ``endpoint`` must come from a bounded set:
+        MetricsMiddleware collapses UUID and numeric path segments to ``:id``,
+        which keeps it to roughly one value per route.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: Request endpoint path
+            status: HTTP status code
+
+        Returns:
+            The label set's id, an index into ``self._http_request_labels``
+        """
+        # str() first: callers may pass e.g. an int status, which intern rejects
+        method = sys.intern(str(method))
+        endpoint = sys.intern(str(endpoint))
+        status = sys.intern(str(status))
+        key = (method, endpoint, status)
+
         with self._lock:
-            # Increment request counter
-            key = (method, endpoint, status)
-            self._http_requests[key] += 1
-
-            # Record duration in histogram buckets
-            for bucket in self._duration_buckets:
-                if duration <= bucket:
-                    self._duration_counts[bucket] += 1
-
-            self._duration_sum += duration
-            self._duration_total_count += 1
-
-            # Record request/response sizes
-            if request_size > 0:
-                self._http_request_size_sum += request_size
-                self._http_request_size_count += 1
-            if response_size > 0:
-                self._http_response_size_sum += response_size
-                self._http_response_size_count += 1
+            label_id = self._http_request_label_ids.get(key)
+            if label_id is None:
+                label_id = len(self._http_request_labels)
+                self._http_request_labels.append(
+                    f'method="{method}",endpoint="{endpoint}",status="{status}"'
+                )
+                # Published last so readers never see an id without its label
+                self._http_request_label_ids[key] = label_id
+        return label_id
 
     def set_agent_tasks_active(self, agent_id: str, count: int) -> None:
         """Set the number of active tasks for an agent.
@@ -107,7 +332,10 @@ class PrometheusMetrics:
             count: Number of active tasks
         """
         with self._lock:
-            self._agent_tasks_active[agent_id] = count
+            # Refreshed on every scrape, so only count actual changes as writes
+            if self._agent_tasks_active.get(agent_id) != count:
+                self._agent_tasks_active[agent_id] = count
+                self._version += 1
 
     def increment_agent_tasks_completed(self, agent_id: str, status: str) -> None:
         """Increment completed task counter for an agent.
@@ -117,8 +345,9 @@ class PrometheusMetrics:
             status: Task completion status (success, failed, canceled)
         """
         with self._lock:
-            key = (agent_id, status)
+            key = (sys.intern(agent_id), sys.intern(status))
             self._agent_tasks_completed[key] += 1
+            self._version += 1
 
     def record_task_duration(self, agent_id: str, status: str, duration: float) -> None:
         """Record task execution duration.
@@ -128,17 +357,24 @@ class PrometheusMetrics:
             status: Task completion status (success, failed, canceled)
             duration: Task duration in seconds
         """
+        # NaN is not an observation, as in record_http_request: bisect would
+        # file it under the first bucket and it would poison the sum
+        if duration != duration:
+            return
+
         with self._lock:
             key = (agent_id, status)
 
-            # Record in histogram buckets
-            for bucket in self._task_duration_buckets:
-                if duration <= bucket:
-                    bucket_key = (agent_id, status, bucket)
-                    self._task_duration_counts[bucket_key] += 1
+            # Record in the smallest bucket with le >= duration
+            counts = self._task_duration_counts.get(key)
+            if counts is None:
+                counts = array("q", [0] * len(self._task_duration_buckets))
+                self._task_duration_counts[key] = counts
+            counts[bisect_left(self._task_duration_buckets, duration)] += 1
 
             self._task_duration_sum[key] += duration
             self._task_duration_total_count[key] += 1
+            self._version += 1
 
     def increment_agent_error(self, agent_id: str, error_type: str) -> None:
         """Increment error counter for an agent.
@@ -150,6 +386,7 @@ class PrometheusMetrics:
         with self._lock:
             key = (agent_id, error_type)
             self._agent_errors[key] += 1
+            self._version += 1
 
     @staticmethod
     def _format_bucket(bucket: float) -> str:
@@ -163,30 +400,53 @@ class PrometheusMetrics:
         """
         return "+Inf" if bucket == float("inf") else str(bucket)
 
-    @staticmethod
-    def _add_metric_header(
-        lines: list[str], metric_name: str, help_text: str, metric_type: str
-    ) -> None:
-        """Add Prometheus metric header lines.
-
-        Args:
-            lines: List to append header lines to
-            metric_name: Name of the metric
-            help_text: Help text describing the metric
-            metric_type: Prometheus metric type (counter, gauge, histogram, summary)
-        """
-        lines.append(f"# HELP {metric_name} {help_text}")
-        lines.append(f"# TYPE {metric_name} {metric_type}")
-
     def increment_requests_in_flight(self) -> None:
         """Increment the number of concurrent requests."""
         with self._lock:
             self._http_requests_in_flight += 1
+            self._version += 1
 
     def decrement_requests_in_flight(self) -> None:
         """Decrement the number of concurrent requests."""
         with self._lock:
             self._http_requests_in_flight = max(0, self._http_requests_in_flight - 1)
+            self._version += 1
+
+    def _current_version(self) -> int:
+        """Get the total number of writes recorded so far.
+
+        Must be called with ``self._lock`` held so the shard list is stable.
+
+        Returns:
+            Monotonic write counter across all metrics and shards
+        """
+        return self._version + sum(shard.version for shard in self._http_shards)
+
+    def _collect_http_shards(self) -> _HttpRequestShard:
+        """Sum all per-thread HTTP request shards into a single snapshot.
+
+        Must be called with ``self._lock`` held so the shard list is stable.
+
+        Returns:
+            A new shard holding the totals across all threads
+        """
+        totals = _HttpRequestShard(len(self._duration_buckets))
+        for shard in self._http_shards:
+            # Slicing copies atomically, so owner threads may keep writing
+            requests = shard.requests[:]
+            if len(requests) > len(totals.requests):
+                totals.requests.extend([0] * (len(requests) - len(totals.requests)))
+            for label_id, count in enumerate(requests):
+                totals.requests[label_id] += count
+            for i, count in enumerate(shard.duration_counts):
+                totals.duration_counts[i] += count
+            totals.duration_sum += shard.duration_sum
+            totals.duration_count += shard.duration_count
+            totals.request_size_sum += shard.request_size_sum
+            totals.request_size_count += shard.request_size_count
+            totals.response_size_sum += shard.response_size_sum
+            totals.response_size_count += shard.response_size_count
+        return totals
 
     def generate_prometheus_text(self) -> str:
         """Generate Prometheus text format metrics.
@@ -194,57 +454,57 @@ class PrometheusMetrics:
         Returns:
             Prometheus-formatted metrics string
         """
+        return self.generate_prometheus_bytes().decode()
+
+    def generate_prometheus_bytes(self) -> bytes:
+        """Generate Prometheus text format metrics, encoded for the response body.
+
+        Returns:
+            UTF-8 encoded Prometheus-formatted metrics
+        """
         lines = []
 
         with self._lock:
+            # Nothing was written since the last scrape: reuse its output
+            version = self._current_version()
+            if self._cached_output is not None and self._cached_output[0] == version:
+                return self._cached_output[1]
+
+            http = self._collect_http_shards()
+
             # HTTP requests total
-            self._add_metric_header(
-                lines, "http_requests_total", "Total number of HTTP requests", "counter"
-            )
-            for (method, endpoint, status), count in sorted(
-                self._http_requests.items()
-            ):
-                lines.append(
-                    f'http_requests_total{{method="{method}",endpoint="{endpoint}",status="{status}"}} {count}'
+            lines.append(_HTTP_REQUESTS_TOTAL_HEADER)
+            lines.extend(
+                f"http_requests_total{{{label}}} {count}"
+                for label, count in sorted(
+                    zip(self._http_request_labels, http.requests)
                 )
+                if count
+            )
 
             # HTTP request duration
             lines.append("")
-            self._add_metric_header(
-                lines,
-                "http_request_duration_seconds",
-                "HTTP request latency",
-                "histogram",
-            )
-            for bucket in self._duration_buckets:
-                count = self._duration_counts[bucket]
-                bucket_str = self._format_bucket(bucket)
+            lines.append(_HTTP_REQUEST_DURATION_SECONDS_HEADER)
+            for bucket_str, count in zip(
+                self._duration_bucket_labels, accumulate(http.duration_counts)
+            ):
                 lines.append(
                     f'http_request_duration_seconds_bucket{{le="{bucket_str}"}} {count}'
                 )
-            lines.append(f"http_request_duration_seconds_sum {self._duration_sum:.1f}")
-            lines.append(
-                f"http_request_duration_seconds_count {self._duration_total_count}"
-            )
+            lines.append(f"http_request_duration_seconds_sum {http.duration_sum:.1f}")
+            lines.append(f"http_request_duration_seconds_count {http.duration_count}")
 
             # Agent tasks active
             if self._agent_tasks_active:
                 lines.append("")
-                self._add_metric_header(
-                    lines, "agent_tasks_active", "Currently active tasks", "gauge"
-                )
+                lines.append(_AGENT_TASKS_ACTIVE_HEADER)
                 for agent_id, count in sorted(self._agent_tasks_active.items()):
                     lines.append(f'agent_tasks_active{{agent_id="{agent_id}"}} {count}')
 
             # Agent tasks completed
             if self._agent_tasks_completed:
                 lines.append("")
-                self._add_metric_header(
-                    lines,
-                    "agent_tasks_completed_total",
-                    "Total completed tasks",
-                    "counter",
-                )
+                lines.append(_AGENT_TASKS_COMPLETED_TOTAL_HEADER)
                 for (agent_id, status), count in sorted(
                     self._agent_tasks_completed.items()
                 ):
@@ -255,24 +515,14 @@ class PrometheusMetrics:
             # Task duration histogram
             if self._task_duration_total_count:
                 lines.append("")
-                self._add_metric_header(
-                    lines,
-                    "task_duration_seconds",
-                    "Task execution duration",
-                    "histogram",
-                )
-
-                # Group by agent_id and status for histogram output
-                agent_status_pairs = set(
-                    (agent_id, status)
-                    for (agent_id, status, _) in self._task_duration_counts.keys()
-                )
+                lines.append(_TASK_DURATION_SECONDS_HEADER)
 
-                for agent_id, status in sorted(agent_status_pairs):
-                    for bucket in self._task_duration_buckets:
-                        bucket_key = (agent_id, status, bucket)
-                        count = self._task_duration_counts.get(bucket_key, 0)
-                        bucket_str = self._format_bucket(bucket)
+                for (agent_id, status), counts in sorted(
+                    self._task_duration_counts.items()
+                ):
+                    for bucket_str, count in zip(
+                        self._task_duration_bucket_labels, accumulate(counts)
+                    ):
                         lines.append(
                             f'task_duration_seconds_bucket{{agent_id="{agent_id}",status="{status}",le="{bucket_str}"}} {count}'
                         )
@@ -290,57 +540,40 @@ class PrometheusMetrics:
             # Agent errors
             if self._agent_errors:
                 lines.append("")
-                self._add_metric_header(
-                    lines, "agent_errors_total", "Total errors by type", "counter"
-                )
+                lines.append(_AGENT_ERRORS_TOTAL_HEADER)
                 for (agent_id, error_type), count in sorted(self._agent_errors.items()):
                     lines.append(
                         f'agent_errors_total{{agent_id="{agent_id}",error_type="{error_type}"}} {count}'
                     )
 
             # Request size metrics
-            if self._http_request_size_count > 0:
+            if http.request_size_count > 0:
                 lines.append("")
-                self._add_metric_header(
-                    lines,
-                    "http_request_size_bytes",
-                    "HTTP request body size",
-                    "summary",
-                )
-                lines.append(
-                    f"http_request_size_bytes_sum {self._http_request_size_sum:.0f}"
-                )
-                lines.append(
-                    f"http_request_size_bytes_count {self._http_request_size_count}"
-                )
+                lines.append(_HTTP_REQUEST_SIZE_BYTES_HEADER)
+                lines.append(f"http_request_size_bytes_sum {http.request_size_sum:.0f}")
+                lines.append(f"http_request_size_bytes_count {http.request_size_count}")
 
             # Response size metrics
-            if self._http_response_size_count > 0:
+            if http.response_size_count > 0:
                 lines.append("")
-                self._add_metric_header(
-                    lines,
-                    "http_response_size_bytes",
-                    "HTTP response body size",
-                    "summary",
-                )
+                lines.append(_HTTP_RESPONSE_SIZE_BYTES_HEADER)
                 lines.append(
-                    f"http_response_size_bytes_sum {self._http_response_size_sum:.0f}"
+                    f"http_response_size_bytes_sum {http.response_size_sum:.0f}"
                 )
                 lines.append(
-                    f"http_response_size_bytes_count {self._http_response_size_count}"
+                    f"http_response_size_bytes_count {http.response_size_count}"
                 )
 
             # Requests in flight
             lines.append("")
-            self._add_metric_header(
-                lines,
-                "http_requests_in_flight",
-                "Current number of HTTP requests being processed",
-                "gauge",
-            )
+            lines.append(_HTTP_REQUESTS_IN_FLIGHT_HEADER)
             lines.append(f"http_requests_in_flight {self._http_requests_in_flight}")
 
-        return "\n".join(lines) + "\n"
+            # Encode once for the whole exposition rather than per line
+            body = ("\n".join(lines) + "\n").encode()
+            self._cached_output = (version, body)
+
+        return body
 
 
 # Global metrics instance
@@ -2,21 +2,32 @@
 
 This package provides reusable helper functions for:
 - UUID validation and normalization
+- Time-ordered (UUIDv7) identifier generation
 - JSONB serialization
 - Security (password masking, SQL injection prevention)
 - Database operations (timestamps, JSONB preparation)
 """
 
+from .identifiers import uuid7
 from .normalization import normalize_message_uuids, normalize_uuid
 from .security import mask_database_url, sanitize_identifier
-from .serialization import serialize_for_jsonb
+from .serialization import (
+    decode_jsonb,
+    encode_jsonb,
+    encode_jsonb_text,
+    serialize_for_jsonb,
+)
 from .validation import validate_uuid_type
 
 __all__ = [
+    "decode_jsonb",
+    "encode_jsonb",
+    "encode_jsonb_text",
     "normalize_message_uuids",
     "normalize_uuid",
     "mask_database_url",
     "sanitize_identifier",
     "serialize_for_jsonb",
+    "uuid7",
     "validate_uuid_type",
 ]
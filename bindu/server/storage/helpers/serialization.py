@@ -1,25 +1,108 @@
 """JSONB serialization utilities for PostgreSQL storage."""
 
+import json
+import re
+from datetime import date, datetime
 from typing import Any
 from uuid import UUID
 
+import orjson
+
+# orjson rejects non-str dict keys by default; json.dumps coerced them
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# A digit run this long may be an integer past 64 bits, which orjson.loads
+# silently turns into a float
+_WIDE_NUMBER = re.compile(r"\d{19,}")
+_WIDE_NUMBER_BYTES = re.compile(rb"\d{19,}")
+
 
 def serialize_for_jsonb(obj: Any) -> Any:
-    """Recursively serialize objects for JSONB storage.
+    """Prepare objects for JSONB storage.
 
-    Converts UUID objects to strings for PostgreSQL JSONB compatibility.
+    Values are handed to the engine unchanged: JSONB columns are encoded with
+    encode_jsonb_text, which serializes UUIDs and datetimes natively, so no
+    pre-walk of large history/artifact payloads is needed.
 
     Args:
         obj: Object to serialize (dict, list, UUID, or primitive)
 
     Returns:
-        Serialized object with UUIDs converted to strings
+        The object itself
+    """
+    return obj
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the non-JSON types orjson handles natively, for the json fallback.
+
+    Args:
+        value: Object json.dumps could not encode
+
+    Returns:
+        JSON-compatible replacement
+
+    Raises:
+        TypeError: If the type is not supported
+    """
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_jsonb(obj: Any) -> bytes:
+    """Encode a value as UTF-8 JSON for a JSONB column.
+
+    orjson is used for speed. It refuses documents nested deeper than 254
+    levels and integers wider than 64 bits, which json.dumps accepts, so
+    those payloads fall back to json.dumps instead of failing the write.
+
+    Args:
+        obj: Object to encode (dict, list, UUID, datetime, or primitive)
+
+    Returns:
+        UTF-8 encoded JSON document
+
+    Raises:
+        TypeError: If obj contains a value neither encoder supports
+    """
+    try:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, default=_json_default, separators=(",", ":")).encode()
+
+
+def encode_jsonb_text(obj: Any) -> str:
+    """Encode a value as JSON text, for drivers that bind JSONB as str.
+
+    Args:
+        obj: Object to encode (dict, list, UUID, datetime, or primitive)
+
+    Returns:
+        JSON document as a string
+
+    Raises:
+        TypeError: If obj contains a value neither encoder supports
+    """
+    return encode_jsonb(obj).decode()
+
+
+def decode_jsonb(data: str | bytes) -> Any:
+    """Decode a JSONB document.
+
+    orjson is used unless the document contains a digit run long enough to be
+    an integer wider than 64 bits; those go through json.loads so the value
+    round-trips exactly instead of becoming a float.
+
+    Args:
+        data: JSON document as text or UTF-8 bytes
+
+    Returns:
+        Decoded Python object
     """
-    if isinstance(obj, UUID):
-        return str(obj)
-    elif isinstance(obj, dict):
-        return {k: serialize_for_jsonb(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [serialize_for_jsonb(item) for item in obj]
-    else:
-        return obj
+    pattern = _WIDE_NUMBER if isinstance(data, str) else _WIDE_NUMBER_BYTES
+    if pattern.search(data):
+        return json.loads(data)
+    return orjson.loads(data)
@@ -25,13 +25,25 @@ Features:
 
 from __future__ import annotations as _annotations
 
+import asyncio
+import logging
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
+import asyncpg
 from sqlalchemy import delete, func, select, update, cast
 from sqlalchemy.dialects.postgresql import insert, JSON
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from tenacity import (
+    AsyncRetrying,
+    before_sleep_log,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from bindu.common.protocol.types import (
     Artifact,
@@ -43,14 +55,19 @@ from bindu.common.protocol.types import (
 )
 from bindu.settings import app_settings
 from bindu.utils.logging import get_logger
+from bindu.utils.retry import TRANSIENT_EXCEPTIONS
 
 from .base import OwnershipError, Storage
 from .helpers import (
+    decode_jsonb,
+    encode_jsonb,
+    encode_jsonb_text,
     mask_database_url,
     normalize_message_uuids,
     normalize_uuid,
     sanitize_identifier,
     serialize_for_jsonb,
+    uuid7,
     validate_uuid_type,
 )
 from .helpers.db_operations import get_current_utc_timestamp, prepare_jsonb_value
@@ -67,12 +84,94 @@ logger = get_logger("bindu.server.storage.postgres_storage")
 ENGINE_NOT_INITIALIZED_ERROR = (
     "PostgreSQL engine not initialized. Call connect() first."
 )
+# Task columns written by submit_tasks_bulk; the rest use server defaults
+BULK_TASK_COLUMNS = (
+    "id",
+    "context_id",
+    "owner_did",
+    "kind",
+    "state",
+    "state_timestamp",
+    "history",
+    "artifacts",
+    "metadata",
+)
+# Single-row task read issued directly on the asyncpg pool by load_task_raw
+LOAD_TASK_RAW_QUERY = (
+    "SELECT id, context_id, kind, state, state_timestamp, history, artifacts, metadata "
+    "FROM tasks WHERE id = $1"
+)
+# Errors worth retrying a storage operation on: network-level failures plus
+# SQLAlchemy's wrapper for lost connections and server-side aborts
+RETRYABLE_DB_EXCEPTIONS = TRANSIENT_EXCEPTIONS + (OperationalError,)
+# Version byte that prefixes jsonb values in PostgreSQL's binary wire format
+JSONB_BINARY_VERSION = b"\x01"
 TERMINAL_STATE_ERROR_TEMPLATE = (
     "Cannot continue task {task_id}: Task is in terminal state '{state}' and is immutable. "
     "Create a new task with referenceTaskIds to continue the conversation."
 )
 
 
+@lru_cache(maxsize=32)
+def _normalize_database_url(database_url: str) -> str:
+    """Ensure a PostgreSQL URL selects the asyncpg driver.
+
+    Args:
+        database_url: URL with a postgresql://, postgresql+asyncpg:// or no scheme
+
+    Returns:
+        URL with the postgresql+asyncpg:// scheme
+    """
+    if database_url.startswith("postgresql://"):
+        return database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if not database_url.startswith("postgresql+asyncpg://"):
+        return f"postgresql+asyncpg://{database_url}"
+    return database_url
+
+
+def _encode_jsonb_binary(value: Any) -> bytes:
+    """Encode a value in jsonb's binary wire format.
+
+    Args:
+        value: Object to encode
+
+    Returns:
+        Version byte followed by the UTF-8 JSON document
+    """
+    return JSONB_BINARY_VERSION + encode_jsonb(value)
+
+
+def _decode_jsonb_binary(data: bytes) -> Any:
+    """Decode a value from jsonb's binary wire format.
+
+    Args:
+        data: Version byte followed by the UTF-8 JSON document
+
+    Returns:
+        Decoded Python object
+    """
+    return decode_jsonb(data[1:])
+
+
+async def _register_jsonb_codec(connection: asyncpg.Connection) -> None:
+    """Exchange jsonb with the server as bytes on a raw asyncpg connection.
+
+    Without a codec asyncpg hands jsonb over as str, so values would be
+    encoded to str, copied to bytes by the driver and parsed again by the
+    caller. The binary codec passes orjson's bytes straight through.
+
+    Args:
+        connection: Newly opened asyncpg connection
+    """
+    await connection.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb_binary,
+        decoder=_decode_jsonb_binary,
+        schema="pg_catalog",
+        format="binary",
+    )
+
+
 class PostgresStorage(Storage[dict[str, Any]]):
     """PostgreSQL storage implementation using SQLAlchemy imperative mapping.
 
@@ -87,6 +186,7 @@ class PostgresStorage(Storage[dict[str, Any]]):
     - Uses SQLAlchemy async engine with connection pool
     - Automatic reconnection on connection loss
     - Configurable pool size and timeouts
+    - Raw asyncpg pool for hot single-row reads (load_task_raw)
     """
 
     def __init__(
@@ -115,10 +215,7 @@ class PostgresStorage(Storage[dict[str, Any]]):
 
         # Ensure asyncpg driver is specified
         if db_url is not None:
-            if db_url.startswith("postgresql://"):
-                db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-            elif not db_url.startswith("postgresql+asyncpg://"):
-                db_url = f"postgresql+asyncpg://{db_url}"
+            db_url = _normalize_database_url(db_url)
 
         self.database_url: str | None = db_url
         self.pool_min = pool_min or app_settings.storage.postgres_pool_min
@@ -130,6 +227,8 @@ class PostgresStorage(Storage[dict[str, Any]]):
 
         self._engine = None
         self._session_factory = None
+        self._raw_pool: asyncpg.Pool | None = None
+        self._raw_pool_lock = asyncio.Lock()
         self.did = did
         self.schema_name: str | None = None
 
@@ -158,10 +257,13 @@ class PostgresStorage(Storage[dict[str, Any]]):
             # Create async engine
             self._engine = create_async_engine(
                 self.database_url,
+                poolclass=AsyncAdaptedQueuePool,
                 pool_size=self.pool_max,
                 max_overflow=0,
                 pool_timeout=self.timeout,
-                pool_pre_ping=True,  # Verify connections before using
+                pool_pre_ping=app_settings.storage.postgres_pool_pre_ping,
+                json_serializer=encode_jsonb_text,
+                json_deserializer=decode_jsonb,
                 echo=False,  # Set to True for SQL query logging
             )
 
@@ -200,6 +302,22 @@ class PostgresStorage(Storage[dict[str, Any]]):
                 async with self._engine.begin() as conn:
                     await conn.execute(select(1))
 
+            # SQLAlchemy opens pooled connections lazily; open pool_min of them
+            # now so the first requests after startup don't pay for the
+            # connection handshake. Overlapping checkouts force distinct ones.
+            # Best-effort: the connection check above already passed, and
+            # connections that fail to open here are opened on demand later.
+            results = await asyncio.gather(
+                *(self._ping() for _ in range(self.pool_min)),
+                return_exceptions=True,
+            )
+            failures = [r for r in results if isinstance(r, BaseException)]
+            if failures:
+                logger.warning(
+                    f"Pre-opened {len(results) - len(failures)}/{len(results)} "
+                    f"pooled connections; the rest open on demand: {failures[0]}"
+                )
+
             logger.info(
                 f"PostgreSQL storage connected to {masked_url} (pool_size={self.pool_max})"
                 + (f" using schema '{self.schema_name}'" if self.schema_name else "")
@@ -209,8 +327,17 @@ class PostgresStorage(Storage[dict[str, Any]]):
             logger.error(f"Failed to connect to PostgreSQL: {e}")
             raise ConnectionError(f"Failed to connect to PostgreSQL: {e}") from e
 
+    async def _ping(self) -> None:
+        """Check out a pooled connection and round-trip a trivial query."""
+        assert self._engine is not None, ENGINE_NOT_INITIALIZED_ERROR
+        async with self._engine.connect() as conn:
+            await conn.execute(select(1))
+
     async def close(self) -> None:
         """Close SQLAlchemy engine and connection pool."""
+        if self._raw_pool:
+            await self._raw_pool.close()
+            self._raw_pool = None
         if self._engine:
             await self._engine.dispose()
             logger.info("PostgreSQL connection pool closed")
@@ -226,6 +353,44 @@ class PostgresStorage(Storage[dict[str, Any]]):
         if self._engine is None or self._session_factory is None:
             raise RuntimeError(ENGINE_NOT_INITIALIZED_ERROR)
 
+    async def _get_raw_pool(self) -> asyncpg.Pool:
+        """Return the raw asyncpg pool, opening it on first use.
+
+        The pool is capped at ``postgres_raw_pool_max`` connections and opens
+        none up front, so deployments that never call load_task_raw pay
+        nothing on top of the SQLAlchemy pool.
+
+        Returns:
+            asyncpg connection pool
+
+        Raises:
+            RuntimeError: If connect() has not been called
+        """
+        self._ensure_connected()
+        if self._raw_pool is not None:
+            return self._raw_pool
+
+        async with self._raw_pool_lock:
+            if self._raw_pool is None:
+                assert self.database_url is not None
+                self._raw_pool = await asyncpg.create_pool(
+                    self.database_url.replace(
+                        "postgresql+asyncpg://", "postgresql://", 1
+                    ),
+                    min_size=0,
+                    max_size=app_settings.storage.postgres_raw_pool_max,
+                    timeout=self.timeout,
+                    command_timeout=self.command_timeout,
+                    init=_register_jsonb_codec,
+                    # Same quoted identifier as the engine's SET search_path
+                    server_settings=(
+                        {"search_path": f'"{sanitize_identifier(self.schema_name)}"'}
+                        if self.schema_name
+                        else None
+                    ),
+                )
+        return self._raw_pool
+
     def _get_session_with_schema(self):
         """Create a session factory that will set search_path on connection.
 
@@ -243,6 +408,9 @@ class PostgresStorage(Storage[dict[str, Any]]):
     async def _retry_on_connection_error(self, func, *args, **kwargs):
         """Retry function on connection errors using Tenacity.
 
+        Backs off exponentially from ``postgres_retry_delay`` with full jitter,
+        so pods that lose the database together do not reconnect in lockstep.
+
         Args:
             func: Async function to retry
             *args: Positional arguments for func
@@ -254,20 +422,31 @@ class PostgresStorage(Storage[dict[str, Any]]):
         Raises:
             Exception: If all retries fail
         """
-        # Use Tenacity-based retry with storage configuration
-        from bindu.utils.retry import execute_with_retry
-
         max_retries = app_settings.storage.postgres_max_retries
         retry_delay = app_settings.storage.postgres_retry_delay
 
-        return await execute_with_retry(
-            func,
-            *args,
-            max_attempts=max_retries,
-            min_wait=retry_delay,
-            max_wait=retry_delay * max_retries,
-            **kwargs,
-        )
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(max_retries),
+            wait=wait_exponential_jitter(
+                initial=retry_delay,
+                max=retry_delay * max_retries,
+                jitter=retry_delay,
+            ),
+            retry=retry_if_exception_type(RETRYABLE_DB_EXCEPTIONS),
+            before_sleep=before_sleep_log(logger, logging.WARNING),
+            reraise=True,
+        ):
+            with attempt:
+                return await func(*args, **kwargs)
+
+    @staticmethod
+    def new_task_id() -> UUID:
+        """Generate a task ID that keeps the tasks primary-key index append-mostly.
+
+        Returns:
+            Time-ordered UUIDv7
+        """
+        return uuid7()
 
     def _row_to_task(self, row) -> Task:
         """Convert database row to Task protocol type.
@@ -332,6 +511,58 @@ class PostgresStorage(Storage[dict[str, Any]]):
 
         return await self._retry_on_connection_error(_load)
 
+    async def load_task_raw(
+        self, task_id: UUID, history_length: int | None = None
+    ) -> Task | None:
+        """Load a task with a single asyncpg fetchrow, bypassing SQLAlchemy.
+
+        Hot-path variant of load_task: no session, no statement compilation,
+        and JSONB columns arrive already decoded by the pool's binary codec.
+
+        Args:
+            task_id: Unique identifier of the task
+            history_length: Optional limit on message history length
+
+        Returns:
+            Task object if found, None otherwise
+
+        Raises:
+            TypeError: If task_id is not UUID
+            RuntimeError: If connect() has not been called
+        """
+        task_id = validate_uuid_type(task_id, "task_id")
+
+        pool = await self._get_raw_pool()
+
+        async def _load():
+            row = await pool.fetchrow(LOAD_TASK_RAW_QUERY, task_id)
+            if row is None:
+                return None
+
+            history, artifacts, metadata = (
+                row["history"],
+                row["artifacts"],
+                row["metadata"],
+            )
+            task = Task(
+                id=row["id"],
+                context_id=row["context_id"],
+                kind=row["kind"],
+                status=TaskStatus(
+                    state=row["state"], timestamp=row["state_timestamp"].isoformat()
+                ),
+                history=history or [],
+                artifacts=artifacts or [],
+                metadata=metadata or {},
+            )
+
+            if history_length is not None and history_length > 0:
+                task["history"] = task["history"][-history_length:]
+
+            return task
+
+        return await self._retry_on_connection_error(_load)
+
     async def submit_task(
         self,
         context_id: UUID,
@@ -462,6 +693,121 @@ class PostgresStorage(Storage[dict[str, Any]]):
 
         return await self._retry_on_connection_error(_submit)
 
+    async def submit_tasks_bulk(
+        self,
+        items: list[tuple[UUID, Message]],
+        caller_did: str | None = None,
+    ) -> list[Task]:
+        """Create many new tasks in one transaction using PostgreSQL COPY.
+
+        Intended for ingest-heavy workloads. Unlike submit_task, every task
+        must be new: continuing an existing task is not supported, and a
+        task ID that already exists fails the whole batch.
+
+        Args:
+            items: (context_id, message) pairs, one per task to create
+            caller_did: Authenticated caller identity, recorded as the owner
+                of every task and of any context created by this call
+
+        Returns:
+            Tasks in 'submitted' state, in the same order as items
+
+        Raises:
+            TypeError: If IDs are invalid types
+            OwnershipError: If any context is owned by a different caller
+        """
+        if not items:
+            return []
+
+        rows = []
+        for context_id, message in items:
+            context_id = validate_uuid_type(context_id, "context_id")
+            task_id = normalize_uuid(message.get("task_id"), "task_id")
+            message = normalize_message_uuids(
+                message, task_id=task_id, context_id=context_id
+            )
+            rows.append((task_id, context_id, encode_jsonb_text([message])))
+
+        context_ids = list(dict.fromkeys(context_id for _, context_id, _ in rows))
+
+        self._ensure_connected()
+
+        async def _submit_bulk():
+            async with self._get_session_with_schema() as session:
+                async with session.begin():
+                    # Ensure contexts exist BEFORE copying tasks (foreign key
+                    # constraint), with the same write-once ownership as
+                    # submit_task
+                    stmt = insert(contexts_table).values(
+                        [
+                            {
+                                "id": context_id,
+                                "owner_did": caller_did,
+                                "context_data": {},
+                                "message_history": [],
+                            }
+                            for context_id in context_ids
+                        ]
+                    )
+                    stmt = stmt.on_conflict_do_nothing(index_elements=["id"])
+                    await session.execute(stmt)
+
+                    owner_rows = await session.execute(
+                        select(contexts_table.c.id, contexts_table.c.owner_did).where(
+                            contexts_table.c.id.in_(context_ids)
+                        )
+                    )
+                    for context_id, owner_did in owner_rows.all():
+                        if owner_did != caller_did:
+                            raise OwnershipError(
+                                f"Context {context_id} is owned by a different caller."
+                            )
+
+                    # COPY the task rows over the session's own asyncpg
+                    # connection so they commit with the context inserts.
+                    # The search_path set on connect applies to the
+                    # unqualified table name.
+                    now = get_current_utc_timestamp()
+                    connection = await session.connection()
+                    raw_connection = await connection.get_raw_connection()
+                    await raw_connection.driver_connection.copy_records_to_table(
+                        tasks_table.name,
+                        columns=BULK_TASK_COLUMNS,
+                        records=[
+                            (
+                                task_id,
+                                context_id,
+                                caller_did,
+                                "task",
+                                "submitted",
+                                now,
+                                history_json,
+                                "[]",
+                                "{}",
+                            )
+                            for task_id, context_id, history_json in rows
+                        ],
+                    )
+
+                    return [
+                        Task(
+                            id=task_id,
+                            context_id=context_id,
+                            kind="task",
+                            status=TaskStatus(
+                                state="submitted", timestamp=now.isoformat()
+                            ),
+                            # Decoded from the stored JSON so UUIDs come back
+                            # as strings, exactly as load_task returns them
+                            history=decode_jsonb(history_json),
+                            artifacts=[],
+                            metadata={},
+                        )
+                        for task_id, context_id, history_json in rows
+                    ]
+
+        return await self._retry_on_connection_error(_submit_bulk)
+
     async def update_task(
         self,
         task_id: UUID,
@@ -653,6 +653,12 @@ class StorageSettings(BaseSettings):
     postgres_pool_max: int = 10
     postgres_timeout: int = 60
     postgres_command_timeout: int = 30
+    # Pre-ping costs a round trip on every pool checkout; enable it only when
+    # idle connections are routinely cut (e.g. by a proxy or failover)
+    postgres_pool_pre_ping: bool = False
+    # Raw asyncpg pool behind load_task_raw; opened on first use, kept small
+    # because it sits alongside the SQLAlchemy pool
+    postgres_raw_pool_max: int = 2
 
     # DID-based schema isolation
     postgres_did: str | None = Field(
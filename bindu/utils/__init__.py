@@ -23,7 +23,6 @@ from .exceptions import (
     HTTPServerError,
 )
 from .retry import create_retry_decorator
-from .server_runner import run_server, setup_signal_handlers
 
 # Organized packages (new structure)
 from .config import load_config_from_env, update_auth_settings
@@ -60,3 +59,27 @@ __all__ = [
     # Retry utilities
     "create_retry_decorator",
 ]
+
+
+# server_runner pulls in uvicorn, which most importers of bindu.utils never
+# need; resolve its re-exports on first access instead (PEP 562)
+_LAZY_SERVER_RUNNER_EXPORTS = ("run_server", "setup_signal_handlers")
+
+
+def __getattr__(name: str):
+    """Import server_runner re-exports on first access.
+
+    Args:
+        name: Attribute requested from the package
+
+    Returns:
+        The requested server_runner function
+
+    Raises:
+        AttributeError: If name is not a lazily exported attribute
+    """
+    if name in _LAZY_SERVER_RUNNER_EXPORTS:
+        from . import server_runner
+
+        return getattr(server_runner, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -59,6 +59,17 @@ TRANSIENT_EXCEPTIONS = (
     OSError,  # Covers BrokenPipeError, etc.
 )
 
+# TRANSIENT_EXCEPTIONS reduced to its base classes (subclasses listed above
+# are implied), so the hot isinstance checks test as few types as possible.
+# On Python 3.12 this collapses to (OSError,).
+_RETRYABLE_EXCEPTIONS = tuple(
+    exc
+    for exc in dict.fromkeys(TRANSIENT_EXCEPTIONS)
+    if not any(
+        exc is not other and issubclass(exc, other) for other in TRANSIENT_EXCEPTIONS
+    )
+)
+
 # HTTP-specific retryable exceptions
 HTTP_RETRYABLE_EXCEPTIONS = TRANSIENT_EXCEPTIONS + (
     HTTPConnectionError,
@@ -67,6 +78,18 @@ HTTP_RETRYABLE_EXCEPTIONS = TRANSIENT_EXCEPTIONS + (
 )
 
 
+def is_retryable_error(exc: BaseException) -> bool:
+    """Check whether an exception is a transient failure worth retrying.
+
+    Args:
+        exc: Exception raised by the operation
+
+    Returns:
+        True for network, timeout and OS-level errors, False otherwise
+    """
+    return isinstance(exc, _RETRYABLE_EXCEPTIONS)
+
+
 def create_retry_decorator(
     operation_type: str,
     max_attempts: int | None = None,
@@ -119,9 +142,10 @@ def create_retry_decorator(
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Get retry parameters from settings or use provided values
-            _max_attempts = max_attempts or getattr(app_settings.retry, max_key)
-            _min_wait = min_wait or getattr(app_settings.retry, min_key)
-            _max_wait = max_wait or getattr(app_settings.retry, max_wait_key)
+            retry_settings = app_settings.retry
+            _max_attempts = max_attempts or getattr(retry_settings, max_key)
+            _min_wait = min_wait or getattr(retry_settings, min_key)
+            _max_wait = max_wait or getattr(retry_settings, max_wait_key)
 
             # Choose wait strategy based on use_jitter
             wait_strategy = (
@@ -133,7 +157,7 @@ def create_retry_decorator(
             async for attempt in AsyncRetrying(
                 stop=stop_after_attempt(_max_attempts),
                 wait=wait_strategy,
-                retry=retry_if_exception_type(TRANSIENT_EXCEPTIONS),
+                retry=retry_if_exception_type(_RETRYABLE_EXCEPTIONS),
                 before_sleep=before_sleep_log(logger, logging.WARNING),
                 after=after_log(logger, logging.INFO),
                 reraise=True,
@@ -276,7 +300,7 @@ async def execute_with_retry(
     async for attempt in AsyncRetrying(
         stop=stop_after_attempt(max_attempts),
         wait=wait_random_exponential(multiplier=1, min=min_wait, max=max_wait),
-        retry=retry_if_exception_type(TRANSIENT_EXCEPTIONS),
+        retry=retry_if_exception_type(_RETRYABLE_EXCEPTIONS),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         after=after_log(logger, logging.INFO),
         reraise=True,
@@ -23,21 +23,9 @@ setup_x402_stubs()
 # PYTEST CONFIGURATION
 # ============================================================================
 
-import asyncio  # noqa: E402
-
-import pytest  # noqa: E402
-
-
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for the test session.
-
-    This fixture ensures all async tests share the same event loop,
-    preventing issues with multiple event loops in tests.
-    """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Async tests and fixtures share one session-scoped event loop; see
+# asyncio_default_test_loop_scope and asyncio_default_fixture_loop_scope
+# in pytest.ini.
 
 
 # ============================================================================
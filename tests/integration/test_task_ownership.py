@@ -15,7 +15,6 @@ from __future__ import annotations
 
 from uuid import uuid4
 
-import pytest
 import pytest_asyncio
 
 from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
@@ -120,7 +119,6 @@ def _is_not_found(response, expected_code=-32001):
 class TestTaskOwnershipIsolation:
     """Every public A2A handler must refuse cross-tenant access."""
 
-    @pytest.mark.asyncio
     async def test_submit_task_stamps_caller_as_owner(self, manager):
         ctx = uuid4()
         tid = uuid4()
@@ -131,7 +129,6 @@ class TestTaskOwnershipIsolation:
         assert await manager.storage.get_task_owner(tid) == ALICE
         assert await manager.storage.get_context_owner(ctx) == ALICE
 
-    @pytest.mark.asyncio
     async def test_get_task_blocks_cross_tenant(self, manager):
         ctx, tid = uuid4(), uuid4()
         await manager.send_message(_send_request(uuid4(), ctx, tid), caller_did=ALICE)
@@ -143,7 +140,6 @@ class TestTaskOwnershipIsolation:
         bob_blocked = await manager.get_task(_get_request(tid), caller_did=BOB)
         assert _is_not_found(bob_blocked)
 
-    @pytest.mark.asyncio
     async def test_cancel_task_blocks_cross_tenant(self, manager):
         ctx, tid = uuid4(), uuid4()
         await manager.send_message(_send_request(uuid4(), ctx, tid), caller_did=ALICE)
@@ -160,7 +156,6 @@ class TestTaskOwnershipIsolation:
             # Scheduler backpressure / terminal-state are acceptable.
             assert "not found" not in alice_resp["error"]["message"].lower()
 
-    @pytest.mark.asyncio
     async def test_task_feedback_blocks_cross_tenant(self, manager):
         ctx, tid = uuid4(), uuid4()
         await manager.send_message(_send_request(uuid4(), ctx, tid), caller_did=ALICE)
@@ -170,7 +165,6 @@ class TestTaskOwnershipIsolation:
         )
         assert _is_not_found(bob_blocked)
 
-    @pytest.mark.asyncio
     async def test_list_tasks_scopes_to_caller(self, manager):
         # Alice submits two tasks across two contexts
         ac1, at1 = uuid4(), uuid4()
@@ -189,7 +183,6 @@ class TestTaskOwnershipIsolation:
         assert alice_ids == {at1, at2}
         assert bob_ids == {bt1}
 
-    @pytest.mark.asyncio
     async def test_list_contexts_scopes_to_caller(self, manager):
         ac, at = uuid4(), uuid4()
         await manager.send_message(_send_request(uuid4(), ac, at), caller_did=ALICE)
@@ -206,7 +199,6 @@ class TestTaskOwnershipIsolation:
         assert alice_ctx_ids == {ac}
         assert bob_ctx_ids == {bc}
 
-    @pytest.mark.asyncio
     async def test_clear_context_blocks_cross_tenant(self, manager):
         ac, at = uuid4(), uuid4()
         await manager.send_message(_send_request(uuid4(), ac, at), caller_did=ALICE)
@@ -219,7 +211,6 @@ class TestTaskOwnershipIsolation:
         # Alice's context must still exist and hold her task.
         assert await manager.storage.get_context_owner(ac) == ALICE
 
-    @pytest.mark.asyncio
     async def test_submit_task_on_foreign_context_blocked(self, manager):
         """An attacker guessing a context_id cannot hijack the conversation."""
         ac = uuid4()
@@ -244,7 +235,6 @@ class TestUnauthenticatedCaller:
     """caller_did=None (auth disabled) shares a single tenancy with other
     unauthenticated callers. This preserves today's dev-mode behavior."""
 
-    @pytest.mark.asyncio
     async def test_null_owner_is_visible_to_null_caller(self, manager):
         ctx, tid = uuid4(), uuid4()
         await manager.send_message(_send_request(uuid4(), ctx, tid), caller_did=None)
@@ -253,7 +243,6 @@ class TestUnauthenticatedCaller:
         assert "result" in resp
         assert resp["result"]["id"] == tid
 
-    @pytest.mark.asyncio
     async def test_null_owner_hidden_from_authenticated_caller(self, manager):
         ctx, tid = uuid4(), uuid4()
         await manager.send_message(_send_request(uuid4(), ctx, tid), caller_did=None)
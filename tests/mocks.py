@@ -2,6 +2,7 @@
 
 import json
 from typing import Any, Callable, Dict, Optional
+from unittest.mock import AsyncMock, MagicMock
 from uuid import UUID
 
 
@@ -221,3 +222,24 @@ class MockNotificationService:
                 "error": error,
             }
         )
+
+
+def make_engine_mock(execute_side_effect: BaseException | None = None) -> MagicMock:
+    """Build a SQLAlchemy AsyncEngine stand-in for PostgresStorage.connect().
+
+    Args:
+        execute_side_effect: Exception raised by the connection test query
+
+    Returns:
+        Engine mock whose begin() and connect() are async context managers
+    """
+    connection = AsyncMock()
+    connection.execute.side_effect = execute_side_effect
+
+    engine = MagicMock()
+    for method in (engine.begin, engine.connect):
+        method.return_value.__aenter__.return_value = connection
+        # A truthy __aexit__ would swallow the test query's exception
+        method.return_value.__aexit__.return_value = False
+    engine.dispose = AsyncMock()
+    return engine
@@ -54,7 +54,6 @@ class TestHydraClientInitialization:
 class TestHydraClientContextManager:
     """Test HydraClient async context manager functionality."""
 
-    @pytest.mark.asyncio
     async def test_context_manager_lifecycle(self):
         """Test async context manager enters and exits properly."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -68,7 +67,6 @@ class TestHydraClientContextManager:
 
                 mock_close.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_close_method(self):
         """Test close method closes HTTP client."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -83,7 +81,6 @@ class TestHydraClientContextManager:
 class TestHydraClientTokenIntrospection:
     """Test token introspection functionality."""
 
-    @pytest.mark.asyncio
     async def test_introspect_token_success(self):
         """Test successful token introspection."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -111,7 +108,6 @@ class TestHydraClientTokenIntrospection:
             assert result["sub"] == "user-123"
             assert result["scope"] == "read write"
 
-    @pytest.mark.asyncio
     async def test_introspect_token_inactive(self):
         """Test introspection of inactive token."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -130,7 +126,6 @@ class TestHydraClientTokenIntrospection:
 
             assert result["active"] is False
 
-    @pytest.mark.asyncio
     async def test_introspect_token_http_error(self):
         """Test token introspection with HTTP error."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -148,7 +143,6 @@ class TestHydraClientTokenIntrospection:
             with pytest.raises(ValueError, match="Hydra introspection failed"):
                 await client.introspect_token("invalid-token")
 
-    @pytest.mark.asyncio
     async def test_introspect_token_network_error(self):
         """Test token introspection with network error."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -166,7 +160,6 @@ class TestHydraClientTokenIntrospection:
 class TestHydraClientOAuthManagement:
     """Test OAuth2 client management operations."""
 
-    @pytest.mark.asyncio
     async def test_create_oauth_client_success(self):
         """Test successful OAuth client creation."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -191,7 +184,6 @@ class TestHydraClientOAuthManagement:
 
             assert result["client_id"] == "test-client"
 
-    @pytest.mark.asyncio
     async def test_create_oauth_client_failure(self):
         """Test OAuth client creation failure."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -209,7 +201,6 @@ class TestHydraClientOAuthManagement:
             with pytest.raises(ValueError, match="Failed to create OAuth client"):
                 await client.create_oauth_client({})
 
-    @pytest.mark.asyncio
     async def test_get_oauth_client_found(self):
         """Test getting existing OAuth client."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -229,7 +220,6 @@ class TestHydraClientOAuthManagement:
             assert result is not None
             assert result["client_id"] == "test-client"
 
-    @pytest.mark.asyncio
     async def test_get_oauth_client_not_found(self):
         """Test getting non-existent OAuth client returns None."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -246,7 +236,6 @@ class TestHydraClientOAuthManagement:
 
             assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_oauth_client_with_did_encoding(self):
         """Test getting OAuth client with DID (special characters encoded)."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -267,7 +256,6 @@ class TestHydraClientOAuthManagement:
             call_args = mock_get.call_args[0][0]
             assert "did%3Abindu%3Atest" in call_args
 
-    @pytest.mark.asyncio
     async def test_list_oauth_clients_success(self):
         """Test listing OAuth clients."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -289,7 +277,6 @@ class TestHydraClientOAuthManagement:
             assert len(result) == 2
             assert result[0]["client_id"] == "client-1"
 
-    @pytest.mark.asyncio
     async def test_delete_oauth_client_success(self):
         """Test successful OAuth client deletion."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -307,7 +294,6 @@ class TestHydraClientOAuthManagement:
 
             assert result is True
 
-    @pytest.mark.asyncio
     async def test_delete_oauth_client_not_found(self):
         """Test deleting non-existent OAuth client returns False."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -329,7 +315,6 @@ class TestHydraClientOAuthManagement:
 class TestHydraClientHealthAndUtilities:
     """Test health check and utility methods."""
 
-    @pytest.mark.asyncio
     async def test_health_check_healthy(self):
         """Test health check when Hydra is healthy."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -347,7 +332,6 @@ class TestHydraClientHealthAndUtilities:
 
             assert result is True
 
-    @pytest.mark.asyncio
     async def test_health_check_unhealthy(self):
         """Test health check when Hydra is unhealthy."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -365,7 +349,6 @@ class TestHydraClientHealthAndUtilities:
 
             assert result is False
 
-    @pytest.mark.asyncio
     async def test_health_check_network_error(self):
         """Test health check with network error returns False."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -380,7 +363,6 @@ class TestHydraClientHealthAndUtilities:
 
             assert result is False
 
-    @pytest.mark.asyncio
     async def test_get_jwks_success(self):
         """Test getting JWKS successfully."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -401,7 +383,6 @@ class TestHydraClientHealthAndUtilities:
             assert "keys" in result
             assert len(result["keys"]) == 1
 
-    @pytest.mark.asyncio
     async def test_revoke_token_success(self):
         """Test successful token revocation."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -419,7 +400,6 @@ class TestHydraClientHealthAndUtilities:
 
             assert result is True
 
-    @pytest.mark.asyncio
     async def test_get_public_key_from_client_success(self):
         """Test getting public key from client metadata."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -441,7 +421,6 @@ class TestHydraClientHealthAndUtilities:
 
             assert result == "z6MkpTHR8VNsBxYAAWHut2Geadd9jSwuBV8xRoAnwWsdvktH"
 
-    @pytest.mark.asyncio
     async def test_get_public_key_from_client_not_found(self):
         """Test getting public key when client doesn't exist."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -453,7 +432,6 @@ class TestHydraClientHealthAndUtilities:
 
             assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_public_key_from_client_no_key_in_metadata(self):
         """Test getting public key when metadata doesn't contain key."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -474,7 +452,6 @@ class TestHydraClientHealthAndUtilities:
 class TestHydraClientEdgeCases:
     """Test edge cases and error handling."""
 
-    @pytest.mark.asyncio
     async def test_introspect_empty_token(self):
         """Test introspecting empty token."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -492,7 +469,6 @@ class TestHydraClientEdgeCases:
             with pytest.raises(ValueError):
                 await client.introspect_token("")
 
-    @pytest.mark.asyncio
     async def test_create_client_with_special_characters_in_did(self):
         """Test creating client with DID containing special characters."""
         client = HydraClient(admin_url="http://localhost:4445")
@@ -516,7 +492,6 @@ class TestHydraClientEdgeCases:
 
             assert result["client_id"] == "did:bindu:agent:test-123"
 
-    @pytest.mark.asyncio
     async def test_concurrent_operations(self):
         """Test multiple concurrent operations."""
         import asyncio
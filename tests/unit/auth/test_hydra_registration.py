@@ -6,7 +6,6 @@ from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
 
 from bindu.auth.hydra.registration import (
     save_agent_credentials,
@@ -246,7 +245,6 @@ class TestLoadAgentCredentials:
 class TestRegisterAgentInHydra:
     """Test agent registration in Hydra."""
 
-    @pytest.mark.asyncio
     async def test_register_agent_auto_registration_disabled(self):
         """Test registration skipped when auto-registration is disabled."""
         with patch("bindu.auth.hydra.registration.app_settings") as mock_settings:
@@ -262,7 +260,6 @@ class TestRegisterAgentInHydra:
 
             assert result is None
 
-    @pytest.mark.asyncio
     async def test_register_agent_new_client_success(self):
         """Test successful registration of new agent."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -302,7 +299,6 @@ class TestRegisterAgentInHydra:
             assert result.agent_id == "agent-123"
             assert len(result.client_secret) > 0
 
-    @pytest.mark.asyncio
     async def test_register_agent_existing_client_with_credentials(self):
         """Test registration when client exists with valid credentials."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -348,7 +344,6 @@ class TestRegisterAgentInHydra:
             assert result is not None
             assert result.client_secret == "existing-secret"
 
-    @pytest.mark.asyncio
     async def test_register_agent_with_did_extension(self):
         """Test registration with DID extension for public key extraction."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -398,7 +393,6 @@ class TestRegisterAgentInHydra:
             )
             assert call_args["metadata"]["key_type"] == "Ed25519"
 
-    @pytest.mark.asyncio
     async def test_register_agent_existing_client_no_credentials_deletes_and_recreates(
         self,
     ):
@@ -442,7 +436,6 @@ class TestRegisterAgentInHydra:
             mock_hydra.delete_oauth_client.assert_called_once_with("did:bindu:test")
             mock_hydra.create_oauth_client.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_register_agent_hydra_error_returns_none(self):
         """Test that Hydra errors during registration return None gracefully."""
         with tempfile.TemporaryDirectory() as tmpdir:
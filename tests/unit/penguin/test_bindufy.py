@@ -1,10 +1,17 @@
 """Minimal tests for bindufy module."""
 
-from unittest.mock import Mock
+import hashlib
+import subprocess
+import sys
+from contextlib import ExitStack
+from dataclasses import FrozenInstanceError
+from unittest.mock import Mock, patch
 import pytest
 from uuid import UUID
 
 from bindu.penguin.bindufy import (
+    _create_deployment_config,
+    _default_host_port,
     _generate_agent_id,
     _normalize_execution_costs,
     _setup_x402_extension,
@@ -12,6 +19,31 @@ from bindu.penguin.bindufy import (
     bindufy,
 )
 
+# bindufy collaborators that touch the filesystem, network or server stack
+BINDUFY_PATCH_TARGETS = {
+    "did": "bindu.penguin.bindufy.initialize_did_extension",
+    "key_dir": "bindu.penguin.bindufy.resolve_key_directory",
+    "skills": "bindu.penguin.bindufy.load_skills",
+    "create": "bindu.penguin.bindufy.create_manifest",
+    "hydra": "bindu.penguin.bindufy._register_in_hydra",
+    "app": "bindu.server.BinduApplication",
+}
+
+
+@pytest.fixture
+def bindufy_mocks():
+    """Patch all bindufy collaborators at once, keyed by BINDUFY_PATCH_TARGETS."""
+    with ExitStack() as stack:
+        yield {
+            name: stack.enter_context(patch(target))
+            for name, target in BINDUFY_PATCH_TARGETS.items()
+        }
+
+
+def _handler(messages):
+    """Minimal handler with the signature bindufy validates."""
+    return "ok"
+
 
 class TestBindufyUtilities:
     """Test bindufy utility functions."""
@@ -37,6 +69,13 @@ class TestBindufyUtilities:
 
         assert id1 != id2
 
+    def test_generate_agent_id_is_stable(self):
+        """Test that the derived ID format does not change between releases."""
+        agent_id = _generate_agent_id({"author": "test@example.com", "name": "Agent"})
+
+        expected = hashlib.sha256(b"test@example.com:Agent").hexdigest()[:32]
+        assert agent_id == UUID(expected)
+
     def test_normalize_execution_costs_single_dict(self):
         """Test normalizing single dict to list."""
         cost = {"amount": "100", "token": "USDC", "network": "base"}
@@ -106,6 +145,37 @@ class TestBindufyUtilities:
         assert host == "localhost"
         assert port == 3773
 
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("http://0.0.0.0:3773/api/v1?debug=1#top", ("0.0.0.0", 3773)),
+            ("https://Agent.Example.com:443", ("agent.example.com", 443)),
+            ("http://agent@localhost:9000/path", ("localhost", 9000)),
+            ("http://[::1]:8080/", ("::1", 8080)),
+            ("http://[::1]", ("::1", 3773)),
+            ("localhost:8080", ("localhost", 3773)),
+        ],
+    )
+    def test_parse_deployment_url_variants(self, url, expected):
+        """Test host/port extraction across URL shapes."""
+        mock_config = Mock()
+        mock_config.url = url
+
+        assert _parse_deployment_url(mock_config) == expected
+
+    @pytest.mark.parametrize(
+        "url",
+        ["http://localhost:99999", "http://localhost:\u00b2", "http://localhost:8o"],
+        ids=["out_of_range", "superscript_digit", "non_digit"],
+    )
+    def test_parse_deployment_url_rejects_invalid_port(self, url):
+        """Test that invalid ports raise like urlparse().port does."""
+        mock_config = Mock()
+        mock_config.url = url
+
+        with pytest.raises(ValueError, match="Port"):
+            _parse_deployment_url(mock_config)
+
     def test_parse_deployment_url_none_returns_defaults(self):
         """Test that None config returns default values."""
         host, port = _parse_deployment_url(None)
@@ -113,6 +183,20 @@ class TestBindufyUtilities:
         assert host == "localhost"
         assert port == 3773
 
+    def test_parse_deployment_url_defaults_read_once(self):
+        """Test that network defaults are read from settings only once."""
+        _default_host_port.cache_clear()
+        with patch("bindu.penguin.bindufy.app_settings") as mock_settings:
+            mock_settings.network.default_host = "0.0.0.0"
+            mock_settings.network.default_port = 8080
+            assert _parse_deployment_url(None) == ("0.0.0.0", 8080)
+
+        try:
+            # Cached from the first call, not re-read from the real settings
+            assert _parse_deployment_url(None) == ("0.0.0.0", 8080)
+        finally:
+            _default_host_port.cache_clear()
+
     def test_normalize_execution_costs_validates_dict_entries(self):
         """Test that non-dict entries in list raise ValueError."""
         with pytest.raises(ValueError, match="must be a dictionary"):
@@ -182,6 +266,114 @@ class TestBindufyUtilities:
         assert extension.pay_to_address == "0x123"
 
 
+class TestCreateDeploymentConfig:
+    """Test deployment config creation."""
+
+    def test_create_deployment_config_complete(self):
+        """Test that all deployment fields are mapped."""
+        config = {
+            "deployment": {
+                "url": "http://localhost:3773",
+                "expose": True,
+                "protocol_version": "2.0.0",
+                "proxy_urls": ["http://proxy:8080"],
+                "cors_origins": ["http://localhost:5173"],
+                "openapi_schema": {"openapi": "3.1.0"},
+            }
+        }
+
+        deployment = _create_deployment_config(config)
+
+        assert deployment is not None
+        assert deployment.url == "http://localhost:3773"
+        assert deployment.expose is True
+        assert deployment.protocol_version == "2.0.0"
+        assert deployment.proxy_urls == ["http://proxy:8080"]
+        assert deployment.cors_origins == ["http://localhost:5173"]
+        assert deployment.openapi_schema == {"openapi": "3.1.0"}
+
+    def test_create_deployment_config_minimal(self):
+        """Test that optional fields fall back to defaults."""
+        deployment = _create_deployment_config(
+            {"deployment": {"url": "http://localhost:3773", "expose": False}}
+        )
+
+        assert deployment is not None
+        assert deployment.protocol_version == "1.0.0"
+        assert deployment.proxy_urls is None
+        assert deployment.cors_origins is None
+        assert deployment.openapi_schema is None
+
+    def test_deployment_config_is_slotted_and_frozen(self):
+        """Test that DeploymentConfig has no per-instance dict and is immutable."""
+        deployment = _create_deployment_config(
+            {"deployment": {"url": "http://localhost:3773", "expose": True}}
+        )
+
+        assert not hasattr(deployment, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            deployment.url = "http://example.com"  # type: ignore[misc]
+
+    def test_create_deployment_config_missing(self):
+        """Test that a missing deployment section returns None."""
+        assert _create_deployment_config({}) is None
+
+    def test_create_deployment_config_missing_required_fields(self):
+        """Test that missing url/expose raise ValueError."""
+        with pytest.raises(ValueError, match="deployment.url, deployment.expose"):
+            _create_deployment_config({"deployment": {"protocol_version": "1.0.0"}})
+
+    def test_create_deployment_config_partial_fields(self):
+        """Test that a single missing required field is reported on its own."""
+        with pytest.raises(ValueError, match="deployment.expose$"):
+            _create_deployment_config({"deployment": {"url": "http://localhost:3773"}})
+
+    def test_create_deployment_config_ignores_extra_fields(self):
+        """Test that unknown deployment keys do not reach DeploymentConfig."""
+        config = _create_deployment_config(
+            {
+                "deployment": {
+                    "url": "http://localhost:3773",
+                    "expose": False,
+                    "unknown": "value",
+                }
+            }
+        )
+
+        assert config is not None
+        assert config.expose is False
+        assert config.protocol_version == "1.0.0"
+
+    def test_create_deployment_config_passes_values_through(self):
+        """Test that config values reach DeploymentConfig unchanged, per call."""
+        openapi_schema = {"paths": {"/": {"responses": {200: {}}}}}
+        deploy = {
+            "url": "http://localhost:3773",
+            "expose": True,
+            "cors_origins": ["http://localhost:5173"],
+            "openapi_schema": openapi_schema,
+        }
+
+        first = _create_deployment_config({"deployment": dict(deploy)})
+        second = _create_deployment_config({"deployment": dict(deploy)})
+
+        assert first is not None and second is not None
+        assert first is not second
+        assert first.openapi_schema is openapi_schema
+        assert 200 in first.openapi_schema["paths"]["/"]["responses"]
+
+
+def test_import_bindufy_does_not_load_uvicorn():
+    """Importing bindufy leaves uvicorn unloaded until a server is started."""
+    code = (
+        "import sys; import bindu.penguin.bindufy; sys.exit('uvicorn' in sys.modules)"
+    )
+
+    result = subprocess.run([sys.executable, "-c", code], check=False)
+
+    assert result.returncode == 0
+
+
 def test_bindufy_non_callable_handler_raises_clear_error():
     """bindufy should fail fast with a clear handler validation message."""
     config = {
@@ -195,3 +387,31 @@ def test_bindufy_non_callable_handler_raises_clear_error():
         match="callable function or coroutine function",
     ):
         bindufy(config=config, handler="not_callable", run_server=False)  # type: ignore[arg-type]
+
+
+class TestBindufy:
+    """Test the bindufy pipeline with its collaborators patched out."""
+
+    CONFIG = {
+        "author": "test@example.com",
+        "name": "Test Agent",
+        "deployment": {"url": "http://localhost:3773", "expose": True},
+    }
+
+    def test_bindufy_minimal_config(self, bindufy_mocks):
+        """Test that bindufy returns the created manifest without serving."""
+        manifest = bindufy(config=dict(self.CONFIG), handler=_handler, run_server=False)
+
+        assert manifest is bindufy_mocks["create"].return_value
+        bindufy_mocks["app"].assert_called_once()
+
+    def test_bindufy_passes_derived_agent_id(self, bindufy_mocks):
+        """Test that the deterministic agent ID reaches DID setup and the manifest."""
+        bindufy(config=dict(self.CONFIG), handler=_handler, run_server=False)
+
+        expected_id = _generate_agent_id(self.CONFIG)
+        assert bindufy_mocks["did"].call_args.kwargs["agent_id"] == expected_id
+        assert bindufy_mocks["create"].call_args.kwargs["id"] == expected_id
+        assert (
+            bindufy_mocks["create"].call_args.kwargs["url"] == "http://localhost:3773"
+        )
@@ -49,6 +49,29 @@ class TestValidateAgentFunction:
         with pytest.raises(ValueError, match="must have only"):
             validate_agent_function(agent_func)
 
+    def test_validate_caches_valid_function(self):
+        """Test that a validated function skips signature inspection next time."""
+
+        def agent_func(messages):
+            return "response"
+
+        validate_agent_function(agent_func)
+
+        with patch("bindu.penguin.manifest.inspect.signature") as mock_signature:
+            validate_agent_function(agent_func)
+
+        mock_signature.assert_not_called()
+
+    def test_validate_does_not_cache_invalid_function(self):
+        """Test that a rejected function is rejected again on every call."""
+
+        def agent_func(message):
+            return "response"
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="must be named 'messages'"):
+                validate_agent_function(agent_func)
+
 
 class TestDefaultAgentTrustIdentityProvider:
     """The agent-card's advertised identity_provider must match the runtime
@@ -0,0 +1,55 @@
+"""Tests for the Prometheus metrics endpoint."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from bindu.server.endpoints.metrics import NO_CACHE_HEADERS, metrics_endpoint
+from bindu.server.metrics import PrometheusMetrics
+
+
+@pytest.fixture
+def metrics():
+    """Fresh metrics collector patched in for the endpoint."""
+    instance = PrometheusMetrics()
+    with patch("bindu.server.endpoints.metrics.get_metrics", return_value=instance):
+        yield instance
+
+
+class TestMetricsEndpoint:
+    """Test the /metrics response."""
+
+    async def test_returns_prometheus_text_body(self, metrics):
+        """Test that the body is the encoded exposition with the 0.0.4 type."""
+        metrics.record_http_request("GET", "/health", "200", 0.05)
+        app = Mock(task_manager=None)
+
+        response = await metrics_endpoint(app, Mock())
+
+        assert isinstance(response.body, bytes)
+        assert response.body == metrics.generate_prometheus_bytes()
+        assert (
+            'http_requests_total{method="GET",endpoint="/health",status="200"} 1'
+            in response.body.decode()
+        )
+        assert (
+            response.headers["content-type"]
+            == "text/plain; version=0.0.4; charset=utf-8"
+        )
+        for header, value in NO_CACHE_HEADERS.items():
+            assert response.headers[header] == value
+
+    async def test_reports_active_agent_tasks(self, metrics):
+        """Test that active task counts from storage appear in the body."""
+        app = Mock()
+        app._storage.count_tasks = AsyncMock(side_effect=[1, 2, 3])
+
+        with patch(
+            "bindu.server.endpoints.metrics.get_agent_did",
+            return_value="did:bindu:test",
+        ):
+            response = await metrics_endpoint(app, Mock())
+
+        assert 'agent_tasks_active{agent_id="did:bindu:test"} 6' in (
+            response.body.decode()
+        )
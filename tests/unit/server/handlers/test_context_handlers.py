@@ -1,7 +1,6 @@
 """Minimal tests for context handlers."""
 
 from unittest.mock import AsyncMock, Mock
-import pytest
 
 from bindu.server.handlers.context_handlers import ContextHandlers
 
@@ -9,7 +8,6 @@ from bindu.server.handlers.context_handlers import ContextHandlers
 class TestContextHandlers:
     """Test context handler functionality."""
 
-    @pytest.mark.asyncio
     async def test_list_contexts_success(self):
         """Test listing contexts successfully."""
         mock_storage = AsyncMock()
@@ -30,7 +28,6 @@ class TestContextHandlers:
         # which means "no owner filter" (dev-mode behavior).
         mock_storage.list_contexts.assert_called_once_with(10, owner_did=None)
 
-    @pytest.mark.asyncio
     async def test_list_contexts_empty(self):
         """Test listing contexts when none exist."""
         mock_storage = AsyncMock()
@@ -43,7 +40,6 @@ class TestContextHandlers:
 
         assert response["result"] == []
 
-    @pytest.mark.asyncio
     async def test_list_contexts_no_params(self):
         """Test listing contexts with no params."""
         mock_storage = AsyncMock()
@@ -56,7 +52,6 @@ class TestContextHandlers:
 
         assert response["result"] == []
 
-    @pytest.mark.asyncio
     async def test_clear_context_success(self):
         """Test clearing context successfully (unauthenticated caller on an
         unowned context — the dev-mode default where caller_did and owner
@@ -75,7 +70,6 @@ class TestContextHandlers:
         assert "cleared successfully" in response["result"]["message"]
         mock_storage.clear_context.assert_called_once_with("ctx123")
 
-    @pytest.mark.asyncio
     async def test_clear_context_not_found(self):
         """Test clearing non-existent context — storage raises ValueError
         after the ownership precheck passes (matched NULL-owner for an
@@ -96,7 +90,6 @@ class TestContextHandlers:
         assert "error" in response
         mock_error_creator.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_clear_context_cross_tenant_blocked(self):
         """Test that a caller cannot clear a context owned by another DID.
         The error is ContextNotFound, not a distinct 'forbidden' — so
@@ -1,7 +1,6 @@
 """Minimal tests for message handler utilities."""
 
 from unittest.mock import AsyncMock, Mock
-import pytest
 from datetime import datetime, timezone
 from typing import cast
 from uuid import uuid4
@@ -13,7 +12,6 @@ from bindu.server.handlers.message_handlers import MessageHandlers
 class TestMessageHandlers:
     """Test message handler functionality."""
 
-    @pytest.mark.asyncio
     async def test_handle_stream_error_loads_task(self):
         """Test stream error handler loads task."""
         mock_storage = AsyncMock()
@@ -44,7 +42,6 @@ class TestMessageHandlers:
         assert result["task_id"] == "task123"
         mock_storage.load_task.assert_called()
 
-    @pytest.mark.asyncio
     async def test_handle_stream_error_updates_failed_state(self):
         """Test stream error handler updates task to failed."""
         mock_storage = AsyncMock()
@@ -79,7 +76,6 @@ class TestMessageHandlers:
         assert result["final"] is True
         mock_storage.update_task.assert_called_once_with("task123", state="failed")
 
-    @pytest.mark.asyncio
     async def test_handle_stream_error_handles_load_failure(self):
         """Test stream error handler when task load fails."""
         mock_storage = AsyncMock()
@@ -98,7 +94,6 @@ class TestMessageHandlers:
         assert "kind" in result
         assert result["status"]["state"] == "failed"
 
-    @pytest.mark.asyncio
     async def test_submit_and_schedule_task_basic(self):
         """Test basic task submission and scheduling."""
         mock_storage = AsyncMock()
@@ -133,7 +128,6 @@ class TestMessageHandlers:
         mock_storage.submit_task.assert_called_once()
         mock_scheduler.run_task.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_submit_and_schedule_task_with_history_length(self):
         """Test task submission with history_length config."""
         mock_storage = AsyncMock()
@@ -167,7 +161,6 @@ class TestMessageHandlers:
         call_args = mock_scheduler.run_task.call_args[0][0]
         assert call_args["history_length"] == 10
 
-    @pytest.mark.asyncio
     async def test_submit_and_schedule_task_with_push_config(self):
         """Test task submission with push notification config."""
         mock_storage = AsyncMock()
@@ -208,7 +201,6 @@ class TestMessageHandlers:
             task_id, push_config, persist=True
         )
 
-    @pytest.mark.asyncio
     async def test_submit_and_schedule_task_with_payment_context(self):
         """Test task submission with payment context in metadata."""
         mock_storage = AsyncMock()
@@ -284,7 +276,6 @@ class TestMessageHandlers:
         assert result.endswith("\n\n")
         assert "status-update" in result
 
-    @pytest.mark.asyncio
     async def test_send_message(self):
         """Test send_message RPC method."""
         mock_storage = AsyncMock()
@@ -320,7 +311,6 @@ class TestMessageHandlers:
         assert response["id"] == "req1"
         assert response["result"]["id"] == task_id
 
-    @pytest.mark.asyncio
     async def test_send_message_rpc(self):
         """Test send_message RPC method."""
         mock_scheduler = AsyncMock()
@@ -353,7 +343,6 @@ class TestMessageHandlers:
         assert response["id"] == "req1"
         assert "result" in response
 
-    @pytest.mark.asyncio
     async def test_stream_message_basic(self):
         """Test stream_message basic functionality."""
         mock_scheduler = AsyncMock()
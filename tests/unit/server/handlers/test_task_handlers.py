@@ -1,7 +1,6 @@
 """Minimal tests for task handlers."""
 
 from unittest.mock import AsyncMock, Mock
-import pytest
 
 from bindu.server.handlers.task_handlers import TaskHandlers
 
@@ -9,7 +8,6 @@ from bindu.server.handlers.task_handlers import TaskHandlers
 class TestTaskHandlers:
     """Test task handler functionality."""
 
-    @pytest.mark.asyncio
     async def test_get_task_success(self):
         """Test getting task successfully (dev-mode: no auth, task owner None)."""
         mock_storage = AsyncMock()
@@ -26,7 +24,6 @@ class TestTaskHandlers:
         assert response["jsonrpc"] == "2.0"
         assert response["result"]["id"] == "task123"
 
-    @pytest.mark.asyncio
     async def test_get_task_cross_tenant_blocked(self):
         """Test that a caller cannot read a task owned by another DID.
         Error is TaskNotFound — indistinguishable from a missing task."""
@@ -49,7 +46,6 @@ class TestTaskHandlers:
         assert "error" in response
         mock_error_creator.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_task_not_found(self):
         """Test getting non-existent task."""
         mock_storage = AsyncMock()
@@ -67,7 +63,6 @@ class TestTaskHandlers:
 
         assert "error" in response
 
-    @pytest.mark.asyncio
     async def test_list_tasks_success(self):
         """Test listing tasks successfully."""
         mock_storage = AsyncMock()
@@ -85,7 +80,6 @@ class TestTaskHandlers:
         # caller_did defaults to None → owner_did filter is None (unfiltered).
         mock_storage.list_tasks.assert_called_once_with(10, owner_did=None)
 
-    @pytest.mark.asyncio
     async def test_list_tasks_filters_by_caller(self):
         """Test that caller_did is threaded into the storage filter."""
         mock_storage = AsyncMock()
@@ -98,7 +92,6 @@ class TestTaskHandlers:
 
         mock_storage.list_tasks.assert_called_once_with(5, owner_did="did:bindu:alice")
 
-    @pytest.mark.asyncio
     async def test_task_feedback_success(self):
         """Test submitting task feedback (dev-mode: no auth)."""
         mock_storage = AsyncMock()
@@ -124,7 +117,6 @@ class TestTaskHandlers:
         assert "Feedback submitted successfully" in response["result"]["message"]
         mock_storage.store_task_feedback.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_cancel_task_terminal_state(self):
         """Test canceling task in terminal state returns error."""
         mock_storage = AsyncMock()
@@ -152,7 +144,6 @@ class TestTaskHandlers:
         assert "error" in response
         mock_scheduler.cancel_task.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_cancel_task_not_found(self):
         """Test canceling non-existent task."""
         mock_storage = AsyncMock()
@@ -30,6 +30,27 @@ class TestAuthMiddlewareBase:
         assert middleware._is_public_endpoint("/metrics") is True
         assert middleware._is_public_endpoint("/api/public/test") is True
         assert middleware._is_public_endpoint("/api/private/test") is False
+        assert middleware._is_public_endpoint("/healthz") is False
+        assert middleware._is_public_endpoint("/api/public") is False
+
+    def test_is_public_endpoint_no_patterns(self):
+        """Test that no path is public when no patterns are configured."""
+        mock_config = Mock()
+        mock_config.public_endpoints = []
+
+        class TestAuthMiddleware(AuthMiddleware):
+            def _initialize_provider(self):
+                pass
+
+            def _validate_token(self, token):
+                return {}
+
+            def _extract_user_info(self, token_payload):
+                return {}
+
+        middleware = TestAuthMiddleware(app=Mock(), auth_config=mock_config)
+
+        assert middleware._is_public_endpoint("/health") is False
 
     def test_extract_token_from_header(self):
         """Test extracting token from Authorization header."""
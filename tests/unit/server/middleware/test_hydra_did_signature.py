@@ -61,7 +61,6 @@ def _signed_headers(did=ALICE_DID, body_len=0):
 class TestDidSignatureFailClosed:
     """The two previously-fail-open paths now refuse the request."""
 
-    @pytest.mark.asyncio
     async def test_missing_signature_headers_rejected(self, middleware):
         """No X-DID-Signature → must reject, not silently accept.
 
@@ -79,7 +78,6 @@ class TestDidSignatureFailClosed:
         # hydra_client must not be consulted at all on this path
         middleware.hydra_client.get_public_key_from_client.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_missing_public_key_rejected(self, middleware):
         """Hydra has no public_key in the DID client's metadata → reject.
 
@@ -98,7 +96,6 @@ class TestDidSignatureFailClosed:
         assert info["did_verified"] is False
         assert info["reason"] == "public_key_unavailable"
 
-    @pytest.mark.asyncio
     async def test_empty_string_public_key_rejected(self, middleware):
         """Empty-string public_key (falsy) is handled the same as missing."""
         middleware.hydra_client.get_public_key_from_client.return_value = ""
@@ -115,7 +112,6 @@ class TestDidSignatureFailClosed:
 class TestDidSignatureRegression:
     """Pre-existing behavior that must keep working after the fix."""
 
-    @pytest.mark.asyncio
     async def test_did_header_mismatch_rejected(self, middleware):
         """Caller authenticated as Alice but signed as Bob → reject.
 
@@ -132,7 +128,6 @@ class TestDidSignatureRegression:
         assert info["reason"] == "did_mismatch"
         middleware.hydra_client.get_public_key_from_client.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_payload_too_large_rejected(self, middleware):
         """Bodies over MAX_BODY_SIZE_BYTES rejected before crypto runs."""
         middleware.hydra_client.get_public_key_from_client.return_value = FAKE_PK
@@ -145,7 +140,6 @@ class TestDidSignatureRegression:
         assert is_valid is False
         assert info["reason"] == "payload_too_large"
 
-    @pytest.mark.asyncio
     async def test_valid_signature_accepted(self, middleware, monkeypatch):
         """Happy path — signature headers present, DID matches, pk
         resolved, crypto verify returns True."""
@@ -177,7 +171,6 @@ class TestDidSignatureRegression:
         replayed = await new_receive()
         assert replayed["body"] == b'{"hello":"world"}'
 
-    @pytest.mark.asyncio
     async def test_invalid_signature_rejected(self, middleware, monkeypatch):
         """Signature headers present and well-formed but crypto fails."""
         middleware.hydra_client.get_public_key_from_client.return_value = FAKE_PK
@@ -27,7 +27,6 @@ class TestMetricsMiddleware:
 
         assert result == "/users/:id/profile"
 
-    @pytest.mark.asyncio
     async def test_dispatch_skips_metrics_endpoint(self):
         """Test that metrics endpoint itself is skipped."""
         mock_request = Mock()
@@ -42,7 +41,6 @@ class TestMetricsMiddleware:
 
         mock_call_next.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_dispatch_records_metrics(self):
         """Test that metrics are recorded for normal requests."""
         mock_request = Mock()
@@ -73,7 +71,6 @@ class TestMetricsMiddleware:
         mock_metrics.decrement_requests_in_flight.assert_called_once()
         mock_metrics.record_http_request.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_dispatch_decrements_on_error(self):
         """Test that requests in flight is decremented even on error."""
         mock_request = Mock()
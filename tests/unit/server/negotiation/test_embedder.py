@@ -49,7 +49,6 @@ class TestSkillEmbedder:
             assert mock_client.call_count == 1
             assert client1 is client2
 
-    @pytest.mark.asyncio
     async def test_embed_without_api_key_raises(self):
         """Test that embedding without API key raises error."""
         embedder = SkillEmbedder(api_key=None)
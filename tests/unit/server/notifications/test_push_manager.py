@@ -29,7 +29,6 @@ class TestPushNotificationManager:
 
         assert manager.manifest == mock_manifest
 
-    @pytest.mark.asyncio
     async def test_initialize_without_storage(self):
         """Test initialize skips loading when no storage configured."""
         manager = PushNotificationManager()
@@ -39,7 +38,6 @@ class TestPushNotificationManager:
         # Should complete without error
         assert len(manager._push_notification_configs) == 0
 
-    @pytest.mark.asyncio
     async def test_initialize_with_storage(self):
         """Test initialize loads configs from storage."""
         mock_storage = AsyncMock()
@@ -119,7 +117,6 @@ class TestPushNotificationManager:
         assert config is not None
         assert config["url"] == "https://global.com/webhook"
 
-    @pytest.mark.asyncio
     async def test_initialize_loads_persisted_configs(self):
         """Test initialize loads persisted configs from storage."""
         mock_storage = AsyncMock()
@@ -135,7 +132,6 @@ class TestPushNotificationManager:
         assert task_id in manager._push_notification_configs
         assert task_id in manager._notification_sequences
 
-    @pytest.mark.asyncio
     async def test_initialize_handles_load_error(self):
         """Test initialize handles errors when loading configs."""
         mock_storage = AsyncMock()
@@ -241,7 +237,6 @@ class TestPushNotificationManager:
 
         assert sanitized["authentication"] == {"type": "bearer"}
 
-    @pytest.mark.asyncio
     async def test_register_push_config_in_memory(self):
         """Test registering push config in memory only."""
         manager = PushNotificationManager()
@@ -256,7 +251,6 @@ class TestPushNotificationManager:
         assert task_id in manager._push_notification_configs
         assert task_id in manager._notification_sequences
 
-    @pytest.mark.asyncio
     async def test_register_push_config_with_storage(self):
         """Test registering push config with storage persistence."""
         mock_storage = AsyncMock()
@@ -272,7 +266,6 @@ class TestPushNotificationManager:
         assert task_id in manager._push_notification_configs
         mock_storage.save_webhook_config.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_remove_push_config_in_memory(self):
         """Test removing push config from memory."""
         manager = PushNotificationManager()
@@ -289,7 +282,6 @@ class TestPushNotificationManager:
         assert removed["id"] == task_id
         assert task_id not in manager._push_notification_configs
 
-    @pytest.mark.asyncio
     async def test_remove_push_config_from_storage(self):
         """Test removing push config from storage."""
         mock_storage = AsyncMock()
@@ -305,7 +297,6 @@ class TestPushNotificationManager:
 
         mock_storage.delete_webhook_config.assert_called_once_with(task_id)
 
-    @pytest.mark.asyncio
     async def test_remove_push_config_not_found(self):
         """Test removing non-existent push config."""
         manager = PushNotificationManager()
@@ -376,7 +367,6 @@ class TestPushNotificationManager:
         assert "sequence" in event
         assert "timestamp" in event
 
-    @pytest.mark.asyncio
     async def test_notify_lifecycle_with_config(self):
         """Test lifecycle notification with webhook config."""
         manager = PushNotificationManager()
@@ -390,7 +380,6 @@ class TestPushNotificationManager:
 
         await manager.notify_lifecycle(task_id, context_id, "completed", True)
 
-    @pytest.mark.asyncio
     async def test_notify_lifecycle_without_config(self):
         """Test lifecycle notification without webhook config."""
         manager = PushNotificationManager()
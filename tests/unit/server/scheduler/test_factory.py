@@ -11,7 +11,6 @@ from bindu.common.models import SchedulerConfig
 class TestSchedulerFactory:
     """Test scheduler factory functionality."""
 
-    @pytest.mark.asyncio
     async def test_create_memory_scheduler_from_config(self):
         """Test creating memory scheduler from config."""
         config = SchedulerConfig(type="memory")
@@ -20,7 +19,6 @@ class TestSchedulerFactory:
 
         assert isinstance(scheduler, InMemoryScheduler)
 
-    @pytest.mark.asyncio
     async def test_create_scheduler_invalid_backend_raises(self):
         """Test that invalid backend raises ValueError."""
         config = SchedulerConfig(type="invalid")  # type: ignore[arg-type]
@@ -28,7 +26,6 @@ class TestSchedulerFactory:
         with pytest.raises(ValueError, match="Unknown scheduler backend"):
             await create_scheduler(config)
 
-    @pytest.mark.asyncio
     async def test_create_redis_scheduler_without_redis_raises(self):
         """Test that Redis scheduler without redis package raises error."""
         config = SchedulerConfig(type="redis", redis_url="redis://localhost:6379/0")
@@ -37,7 +34,6 @@ class TestSchedulerFactory:
             with pytest.raises(ValueError, match="requires redis package"):
                 await create_scheduler(config)
 
-    @pytest.mark.asyncio
     async def test_create_redis_scheduler_constructs_url_from_components(self):
         """Test that Redis scheduler can construct URL from components."""
         config = SchedulerConfig(
@@ -54,7 +50,6 @@ class TestSchedulerFactory:
                 assert "redis_url" in call_kwargs
                 assert call_kwargs["redis_url"] == "redis://localhost:6379/0"
 
-    @pytest.mark.asyncio
     async def test_close_scheduler(self):
         """Test closing scheduler gracefully."""
         mock_scheduler = Mock()
@@ -64,7 +59,6 @@ class TestSchedulerFactory:
 
         mock_scheduler.__aexit__.assert_called_once_with(None, None, None)
 
-    @pytest.mark.asyncio
     async def test_close_scheduler_handles_errors(self):
         """Test that close_scheduler handles errors gracefully."""
         mock_scheduler = Mock()
@@ -1,6 +1,5 @@
 """Minimal tests for in-memory scheduler."""
 
-import pytest
 from uuid import uuid4
 
 from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
@@ -9,7 +8,6 @@ from bindu.server.scheduler.memory_scheduler import InMemoryScheduler
 class TestInMemoryScheduler:
     """Test in-memory scheduler functionality."""
 
-    @pytest.mark.asyncio
     async def test_scheduler_context_manager(self):
         """Test scheduler can be used as async context manager."""
         scheduler = InMemoryScheduler()
@@ -18,7 +16,6 @@ class TestInMemoryScheduler:
             assert hasattr(scheduler, "_write_stream")
             assert hasattr(scheduler, "_read_stream")
 
-    @pytest.mark.asyncio
     async def test_run_task(self):
         """Test scheduling a task for execution."""
         scheduler = InMemoryScheduler()
@@ -37,7 +34,6 @@ class TestInMemoryScheduler:
             assert operation["operation"] == "run"
             assert operation["params"]["task_id"] == task_params["task_id"]
 
-    @pytest.mark.asyncio
     async def test_cancel_task(self):
         """Test canceling a task."""
         scheduler = InMemoryScheduler()
@@ -52,7 +48,6 @@ class TestInMemoryScheduler:
             assert operation["operation"] == "cancel"
             assert operation["params"]["task_id"] == task_id
 
-    @pytest.mark.asyncio
     async def test_pause_task(self):
         """Test pausing a task."""
         scheduler = InMemoryScheduler()
@@ -67,7 +62,6 @@ class TestInMemoryScheduler:
             assert operation["operation"] == "pause"
             assert operation["params"]["task_id"] == task_id
 
-    @pytest.mark.asyncio
     async def test_resume_task(self):
         """Test resuming a task."""
         scheduler = InMemoryScheduler()
@@ -82,7 +76,6 @@ class TestInMemoryScheduler:
             assert operation["operation"] == "resume"
             assert operation["params"]["task_id"] == task_id
 
-    @pytest.mark.asyncio
     async def test_receive_task_operations(self):
         """Test receiving task operations from scheduler."""
         scheduler = InMemoryScheduler()
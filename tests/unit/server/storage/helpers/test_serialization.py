@@ -1,64 +1,105 @@
 """Tests for storage serialization helpers."""
 
+import json
+from datetime import UTC, datetime
 from uuid import uuid4
 
-from bindu.server.storage.helpers.serialization import serialize_for_jsonb
+from bindu.server.storage.helpers.serialization import (
+    decode_jsonb,
+    encode_jsonb_text,
+    serialize_for_jsonb,
+)
 
 
 class TestSerialization:
     """Test serialization helper functions."""
 
     def test_serialize_uuid(self):
-        """Test serializing UUID to string."""
+        """Test that UUIDs are encoded as JSON strings."""
         test_uuid = uuid4()
 
-        result = serialize_for_jsonb(test_uuid)
-
-        assert isinstance(result, str)
-        assert result == str(test_uuid)
+        assert encode_jsonb_text(test_uuid) == f'"{test_uuid}"'
 
     def test_serialize_dict_with_uuids(self):
-        """Test serializing dict containing UUIDs."""
+        """Test encoding a dict containing UUIDs."""
         test_uuid = uuid4()
         data = {"id": test_uuid, "name": "test"}
 
-        result = serialize_for_jsonb(data)
+        result = encode_jsonb_text(data)
 
-        assert isinstance(result, dict)
-        assert isinstance(result["id"], str)
-        assert result["id"] == str(test_uuid)
-        assert result["name"] == "test"
+        assert result == f'{{"id":"{test_uuid}","name":"test"}}'
 
     def test_serialize_list_with_uuids(self):
-        """Test serializing list containing UUIDs."""
+        """Test encoding a list containing UUIDs."""
         uuid1 = uuid4()
         uuid2 = uuid4()
-        data = [uuid1, uuid2, "string"]
 
-        result = serialize_for_jsonb(data)
+        result = encode_jsonb_text([uuid1, uuid2, "string"])
 
-        assert isinstance(result, list)
-        assert result[0] == str(uuid1)
-        assert result[1] == str(uuid2)
-        assert result[2] == "string"
+        assert result == f'["{uuid1}","{uuid2}","string"]'
 
     def test_serialize_nested_structure(self):
-        """Test serializing nested dict/list with UUIDs."""
+        """Test encoding nested dict/list with UUIDs and datetimes."""
         test_uuid = uuid4()
         data = {
             "tasks": [{"id": test_uuid, "status": "pending"}],
-            "count": 1,
+            "at": datetime(2025, 1, 1, tzinfo=UTC),
         }
 
-        result = serialize_for_jsonb(data)
+        result = encode_jsonb_text(data)
+
+        assert result == (
+            f'{{"tasks":[{{"id":"{test_uuid}","status":"pending"}}],'
+            '"at":"2025-01-01T00:00:00+00:00"}'
+        )
 
-        assert isinstance(result["tasks"][0]["id"], str)
-        assert result["tasks"][0]["id"] == str(test_uuid)
-        assert result["count"] == 1
+    def test_serialize_non_str_keys(self):
+        """Test that non-string dict keys are coerced like json.dumps did."""
+        assert encode_jsonb_text({1: "a"}) == '{"1":"a"}'
 
     def test_serialize_primitive_types(self):
-        """Test serializing primitive types."""
-        assert serialize_for_jsonb("string") == "string"
-        assert serialize_for_jsonb(123) == 123
-        assert serialize_for_jsonb(True) is True
-        assert serialize_for_jsonb(None) is None
+        """Test encoding primitive types."""
+        assert encode_jsonb_text("string") == '"string"'
+        assert encode_jsonb_text(123) == "123"
+        assert encode_jsonb_text(True) == "true"
+        assert encode_jsonb_text(None) == "null"
+
+    def test_serialize_deeply_nested_structure(self):
+        """Test that nesting past orjson's 254-level limit still encodes."""
+        test_uuid = uuid4()
+        data: dict = {"id": test_uuid}
+        for _ in range(500):
+            data = {"child": [data]}
+
+        result = json.loads(encode_jsonb_text(data))
+
+        for _ in range(500):
+            result = result["child"][0]
+        assert result == {"id": str(test_uuid)}
+
+    def test_serialize_big_int(self):
+        """Test that integers wider than 64 bits still encode."""
+        data = {"value": 2**70, "id": uuid4()}
+
+        assert json.loads(encode_jsonb_text(data)) == {
+            "value": 2**70,
+            "id": str(data["id"]),
+        }
+
+    def test_decode_big_int_round_trips(self):
+        """Test that integers wider than 64 bits decode as ints, not floats."""
+        encoded = encode_jsonb_text({"value": 2**70, "name": "x"})
+
+        assert decode_jsonb(encoded) == {"value": 2**70, "name": "x"}
+        assert decode_jsonb(encoded.encode()) == {"value": 2**70, "name": "x"}
+
+    def test_decode_plain_document(self):
+        """Test decoding text and bytes documents."""
+        assert decode_jsonb('{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+        assert decode_jsonb(b'{"a": true}') == {"a": True}
+
+    def test_serialize_for_jsonb_is_passthrough(self):
+        """Test that values reach the encoder without a copy."""
+        data = {"id": uuid4(), "history": [{"kind": "message"}]}
+
+        assert serialize_for_jsonb(data) is data
@@ -43,7 +43,6 @@ def sample_message(sample_task_id, sample_context_id):
 class TestTaskOperations:
     """Test task CRUD operations."""
 
-    @pytest.mark.asyncio
     async def test_submit_new_task(self, storage, sample_context_id, sample_message):
         """Test creating a new task."""
         task = await storage.submit_task(sample_context_id, sample_message)
@@ -55,7 +54,6 @@ class TestTaskOperations:
         assert len(task["history"]) == 1
         assert task["history"][0] == sample_message
 
-    @pytest.mark.asyncio
     async def test_submit_task_adds_to_context(
         self, storage, sample_context_id, sample_message
     ):
@@ -66,7 +64,6 @@ class TestTaskOperations:
         assert sample_context_id in storage.contexts
         assert task_id in storage.contexts[sample_context_id]
 
-    @pytest.mark.asyncio
     async def test_submit_task_with_string_task_id(self, storage, sample_context_id):
         """Test submitting task with string task_id (should convert to UUID)."""
         from bindu.common.protocol.types import TextPart
@@ -84,7 +81,6 @@ class TestTaskOperations:
         task = await storage.submit_task(sample_context_id, message)
         assert task["id"] == task_id
 
-    @pytest.mark.asyncio
     async def test_submit_task_normalizes_message_ids(
         self, storage, sample_context_id, sample_message
     ):
@@ -95,7 +91,6 @@ class TestTaskOperations:
         task = await storage.submit_task(sample_context_id, sample_message)
         assert task["history"][0]["message_id"] == message_id
 
-    @pytest.mark.asyncio
     async def test_submit_task_normalizes_reference_task_ids(
         self, storage, sample_context_id, sample_message
     ):
@@ -106,7 +101,6 @@ class TestTaskOperations:
         task = await storage.submit_task(sample_context_id, sample_message)
         assert task["history"][0]["reference_task_ids"] == [ref_id1, ref_id2]
 
-    @pytest.mark.asyncio
     async def test_clear_context(self, storage, sample_context_id, sample_message):
         """Test clearing a context."""
         await storage.submit_task(sample_context_id, sample_message)
@@ -116,7 +110,6 @@ class TestTaskOperations:
         contexts = await storage.list_contexts()
         assert sample_context_id not in contexts
 
-    @pytest.mark.asyncio
     async def test_save_and_load_webhook_config(self, storage):
         """Test saving and loading webhook configuration."""
         task_id = uuid4()
@@ -131,7 +124,6 @@ class TestTaskOperations:
 
         assert loaded == config
 
-    @pytest.mark.asyncio
     async def test_delete_webhook_config(self, storage):
         """Test deleting webhook configuration."""
         task_id = uuid4()
@@ -143,7 +135,6 @@ class TestTaskOperations:
         loaded = await storage.load_webhook_config(task_id)
         assert loaded is None
 
-    @pytest.mark.asyncio
     async def test_load_nonexistent_webhook_config(self, storage):
         """Test loading webhook config that doesn't exist."""
         task_id = uuid4()
@@ -152,7 +143,6 @@ class TestTaskOperations:
 
         assert loaded is None
 
-    @pytest.mark.asyncio
     async def test_delete_nonexistent_webhook_config(self, storage):
         """Test deleting webhook config that doesn't exist."""
         task_id = uuid4()
@@ -160,14 +150,12 @@ class TestTaskOperations:
         # Should not raise error
         await storage.delete_webhook_config(task_id)
 
-    @pytest.mark.asyncio
     async def test_list_contexts_empty(self, storage):
         """Test listing contexts when none exist."""
         contexts = await storage.list_contexts()
 
         assert contexts == []
 
-    @pytest.mark.asyncio
     async def test_continue_non_terminal_task(
         self, storage, sample_context_id, sample_message
     ):
@@ -192,7 +180,6 @@ class TestTaskOperations:
         assert len(continued_task["history"]) == 2
         assert continued_task["status"]["state"] == "submitted"
 
-    @pytest.mark.asyncio
     async def test_submit_terminal_task_raises_error(
         self, storage, sample_context_id, sample_message
     ):
@@ -214,7 +201,6 @@ class TestTaskOperations:
         with pytest.raises(ValueError, match="terminal state"):
             await storage.submit_task(sample_context_id, new_message)
 
-    @pytest.mark.asyncio
     async def test_load_task(self, storage, sample_context_id, sample_message):
         """Test loading an existing task."""
         submitted_task = await storage.submit_task(sample_context_id, sample_message)
@@ -224,7 +210,6 @@ class TestTaskOperations:
         assert loaded_task["id"] == submitted_task["id"]
         assert loaded_task["context_id"] == sample_context_id
 
-    @pytest.mark.asyncio
     async def test_load_task_returns_deep_copy(
         self, storage, sample_context_id, sample_message
     ):
@@ -237,7 +222,6 @@ class TestTaskOperations:
         reloaded_task = await storage.load_task(task["id"])
         assert len(reloaded_task["history"]) == 1
 
-    @pytest.mark.asyncio
     async def test_load_task_with_history_limit(
         self, storage, sample_context_id, sample_message
     ):
@@ -260,13 +244,11 @@ class TestTaskOperations:
         loaded_task = await storage.load_task(task["id"], history_length=3)
         assert len(loaded_task["history"]) == 3
 
-    @pytest.mark.asyncio
     async def test_load_nonexistent_task(self, storage):
         """Test loading a task that doesn't exist."""
         result = await storage.load_task(uuid4())
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_update_task_state(self, storage, sample_context_id, sample_message):
         """Test updating task state."""
         task = await storage.submit_task(sample_context_id, sample_message)
@@ -275,7 +257,6 @@ class TestTaskOperations:
         assert updated_task["status"]["state"] == "working"
         assert "timestamp" in updated_task["status"]
 
-    @pytest.mark.asyncio
     async def test_update_task_with_artifacts(
         self, storage, sample_context_id, sample_message
     ):
@@ -299,7 +280,6 @@ class TestTaskOperations:
         assert "artifacts" in updated_task
         assert len(updated_task["artifacts"]) == 2
 
-    @pytest.mark.asyncio
     async def test_update_task_with_messages(
         self, storage, sample_context_id, sample_message
     ):
@@ -326,7 +306,6 @@ class TestTaskOperations:
         assert updated_task["history"][1]["task_id"] == task["id"]
         assert updated_task["history"][1]["context_id"] == sample_context_id
 
-    @pytest.mark.asyncio
     async def test_update_task_with_metadata(
         self, storage, sample_context_id, sample_message
     ):
@@ -341,7 +320,6 @@ class TestTaskOperations:
         assert "metadata" in updated_task
         assert updated_task["metadata"]["key1"] == "value1"
 
-    @pytest.mark.asyncio
     async def test_update_task_merges_metadata(
         self, storage, sample_context_id, sample_message
     ):
@@ -355,13 +333,11 @@ class TestTaskOperations:
         assert updated_task["metadata"]["key1"] == "value1"
         assert updated_task["metadata"]["key2"] == "value2"
 
-    @pytest.mark.asyncio
     async def test_update_nonexistent_task_raises_error(self, storage):
         """Test updating a nonexistent task raises KeyError."""
         with pytest.raises(KeyError):
             await storage.update_task(uuid4(), "working")
 
-    @pytest.mark.asyncio
     async def test_update_task_with_invalid_message_type_raises_error(
         self, storage, sample_context_id, sample_message
     ):
@@ -371,7 +347,6 @@ class TestTaskOperations:
         with pytest.raises(TypeError, match="Message must be dict"):
             await storage.update_task(task["id"], "working", new_messages=["invalid"])
 
-    @pytest.mark.asyncio
     async def test_list_tasks(self, storage, sample_context_id):
         """Test listing all tasks."""
         from bindu.common.protocol.types import TextPart
@@ -391,7 +366,6 @@ class TestTaskOperations:
         tasks = await storage.list_tasks()
         assert len(tasks) == 3
 
-    @pytest.mark.asyncio
     async def test_list_tasks_with_limit(self, storage, sample_context_id):
         """Test listing tasks with length limit."""
         from bindu.common.protocol.types import TextPart
@@ -410,7 +384,6 @@ class TestTaskOperations:
         tasks = await storage.list_tasks(length=3)
         assert len(tasks) == 3
 
-    @pytest.mark.asyncio
     async def test_list_tasks_with_offset(self, storage, sample_context_id):
         """Test listing tasks with offset."""
         from bindu.common.protocol.types import TextPart
@@ -429,7 +402,6 @@ class TestTaskOperations:
         tasks = await storage.list_tasks(offset=2)
         assert len(tasks) == 3
 
-    @pytest.mark.asyncio
     async def test_count_tasks(self, storage, sample_context_id):
         """Test counting all tasks."""
         from bindu.common.protocol.types import TextPart
@@ -448,7 +420,6 @@ class TestTaskOperations:
         count = await storage.count_tasks()
         assert count == 3
 
-    @pytest.mark.asyncio
     async def test_count_tasks_by_status(self, storage, sample_context_id):
         """Test counting tasks filtered by status."""
         from bindu.common.protocol.types import TextPart
@@ -472,7 +443,6 @@ class TestTaskOperations:
         assert completed_count == 2
         assert submitted_count == 3
 
-    @pytest.mark.asyncio
     async def test_list_tasks_by_context(self, storage):
         """Test listing tasks by context."""
         from bindu.common.protocol.types import TextPart
@@ -511,7 +481,6 @@ class TestTaskOperations:
 class TestContextOperations:
     """Test context operations."""
 
-    @pytest.mark.asyncio
     async def test_load_context(self, storage, sample_context_id, sample_message):
         """Test loading context."""
         await storage.submit_task(sample_context_id, sample_message)
@@ -521,18 +490,15 @@ class TestContextOperations:
         assert "task_ids" in context
         assert sample_message["task_id"] in context["task_ids"]
 
-    @pytest.mark.asyncio
     async def test_load_nonexistent_context(self, storage):
         """Test loading a nonexistent context."""
         result = await storage.load_context(uuid4())
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_update_context(self, storage, sample_context_id):
         """Test updating context (backward compatibility)."""
         await storage.update_context(sample_context_id, {"key": "value"})
 
-    @pytest.mark.asyncio
     async def test_append_to_contexts(self, storage, sample_context_id):
         """Test appending to contexts (deprecated but should not break)."""
         from bindu.common.protocol.types import TextPart
@@ -549,7 +515,6 @@ class TestContextOperations:
         ]
         await storage.append_to_contexts(sample_context_id, messages)
 
-    @pytest.mark.asyncio
     async def test_append_to_contexts_with_invalid_type_raises_error(
         self, storage, sample_context_id
     ):
@@ -557,7 +522,6 @@ class TestContextOperations:
         with pytest.raises(TypeError, match="messages must be list"):
             await storage.append_to_contexts(sample_context_id, "invalid")
 
-    @pytest.mark.asyncio
     async def test_list_contexts(self, storage):
         """Test listing all contexts."""
         from bindu.common.protocol.types import TextPart
@@ -579,7 +543,6 @@ class TestContextOperations:
         assert all("context_id" in c for c in context_list)
         assert all("task_count" in c for c in context_list)
 
-    @pytest.mark.asyncio
     async def test_clear_context(self, storage, sample_context_id, sample_message):
         """Test clearing a context."""
         task = await storage.submit_task(sample_context_id, sample_message)
@@ -591,7 +554,6 @@ class TestContextOperations:
         assert task["id"] not in storage.tasks
         assert task["id"] not in storage.task_feedback
 
-    @pytest.mark.asyncio
     async def test_clear_nonexistent_context_raises_error(self, storage):
         """Test clearing a nonexistent context raises ValueError."""
         with pytest.raises(ValueError, match="not found"):
@@ -601,7 +563,6 @@ class TestContextOperations:
 class TestFeedbackOperations:
     """Test feedback operations."""
 
-    @pytest.mark.asyncio
     async def test_store_task_feedback(
         self, storage, sample_context_id, sample_message
     ):
@@ -614,7 +575,6 @@ class TestFeedbackOperations:
         assert task["id"] in storage.task_feedback
         assert storage.task_feedback[task["id"]][0] == feedback
 
-    @pytest.mark.asyncio
     async def test_store_multiple_feedback_entries(
         self, storage, sample_context_id, sample_message
     ):
@@ -627,7 +587,6 @@ class TestFeedbackOperations:
         feedback_list = await storage.get_task_feedback(task["id"])
         assert len(feedback_list) == 2
 
-    @pytest.mark.asyncio
     async def test_store_feedback_with_invalid_type_raises_error(
         self, storage, sample_context_id, sample_message
     ):
@@ -637,7 +596,6 @@ class TestFeedbackOperations:
         with pytest.raises(TypeError, match="feedback_data must be dict"):
             await storage.store_task_feedback(task["id"], "invalid")
 
-    @pytest.mark.asyncio
     async def test_get_task_feedback(self, storage, sample_context_id, sample_message):
         """Test retrieving task feedback."""
         task = await storage.submit_task(sample_context_id, sample_message)
@@ -647,7 +605,6 @@ class TestFeedbackOperations:
         retrieved = await storage.get_task_feedback(task["id"])
         assert retrieved == [feedback]
 
-    @pytest.mark.asyncio
     async def test_get_feedback_for_nonexistent_task(self, storage):
         """Test getting feedback for nonexistent task returns None."""
         result = await storage.get_task_feedback(uuid4())
@@ -657,7 +614,6 @@ class TestFeedbackOperations:
 class TestWebhookOperations:
     """Test webhook configuration operations."""
 
-    @pytest.mark.asyncio
     async def test_save_webhook_config(self, storage, sample_task_id):
         """Test saving webhook configuration."""
         config = PushNotificationConfig(id=uuid4(), url="https://example.com/webhook")
@@ -667,7 +623,6 @@ class TestWebhookOperations:
         assert sample_task_id in storage._webhook_configs
         assert storage._webhook_configs[sample_task_id] == config
 
-    @pytest.mark.asyncio
     async def test_load_webhook_config(self, storage, sample_task_id):
         """Test loading webhook configuration."""
         config = PushNotificationConfig(id=uuid4(), url="https://example.com/webhook")
@@ -676,13 +631,11 @@ class TestWebhookOperations:
         loaded = await storage.load_webhook_config(sample_task_id)
         assert loaded == config
 
-    @pytest.mark.asyncio
     async def test_load_nonexistent_webhook_config(self, storage):
         """Test loading nonexistent webhook config returns None."""
         result = await storage.load_webhook_config(uuid4())
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_delete_webhook_config(self, storage, sample_task_id):
         """Test deleting webhook configuration."""
         config = PushNotificationConfig(id=uuid4(), url="https://example.com/webhook")
@@ -692,12 +645,10 @@ class TestWebhookOperations:
 
         assert sample_task_id not in storage._webhook_configs
 
-    @pytest.mark.asyncio
     async def test_delete_nonexistent_webhook_config(self, storage):
         """Test deleting nonexistent webhook config doesn't raise error."""
         await storage.delete_webhook_config(uuid4())
 
-    @pytest.mark.asyncio
     async def test_load_all_webhook_configs(self, storage):
         """Test loading all webhook configurations."""
         configs = {
@@ -719,7 +670,6 @@ class TestWebhookOperations:
 class TestUtilityOperations:
     """Test utility operations."""
 
-    @pytest.mark.asyncio
     async def test_clear_all(self, storage, sample_context_id, sample_message):
         """Test clearing all data."""
         task = await storage.submit_task(sample_context_id, sample_message)
@@ -735,7 +685,6 @@ class TestUtilityOperations:
         assert len(storage.task_feedback) == 0
         assert len(storage._webhook_configs) == 0
 
-    @pytest.mark.asyncio
     async def test_close(self, storage, sample_context_id, sample_message):
         """Test closing storage clears all data."""
         await storage.submit_task(sample_context_id, sample_message)
@@ -748,19 +697,16 @@ class TestUtilityOperations:
 class TestValidation:
     """Test input validation."""
 
-    @pytest.mark.asyncio
     async def test_invalid_task_id_type_raises_error(self, storage):
         """Test that invalid task_id type raises TypeError."""
         with pytest.raises(TypeError):
             await storage.load_task("not-a-uuid")
 
-    @pytest.mark.asyncio
     async def test_invalid_context_id_type_raises_error(self, storage):
         """Test that invalid context_id type raises TypeError."""
         with pytest.raises(TypeError):
             await storage.load_context("not-a-uuid")
 
-    @pytest.mark.asyncio
     async def test_submit_task_with_invalid_task_id_raises_error(
         self, storage, sample_context_id
     ):
@@ -0,0 +1,569 @@
+"""Tests for PostgresStorage that do not need a live database."""
+
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import RFC_4122, UUID, uuid4
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential_jitter
+
+from bindu.server.storage.base import OwnershipError
+from bindu.server.storage.postgres_storage import (
+    BULK_TASK_COLUMNS,
+    LOAD_TASK_RAW_QUERY,
+    PostgresStorage,
+    _decode_jsonb_binary,
+    _encode_jsonb_binary,
+    _register_jsonb_codec,
+)
+from bindu.settings import app_settings
+from tests.mocks import make_engine_mock
+from tests.utils import SAMPLE_MESSAGE, create_test_message
+
+
+@dataclass(slots=True)
+class FakeTaskRow:
+    """Stand-in for a tasks table row; unknown attributes fail loudly."""
+
+    id: UUID = field(default_factory=uuid4)
+    context_id: UUID = field(default_factory=uuid4)
+    kind: str = "task"
+    state: str = "submitted"
+    state_timestamp: datetime = field(
+        default_factory=lambda: datetime(2025, 1, 1, tzinfo=UTC)
+    )
+    history: list[Any] | None = field(default_factory=list)
+    artifacts: list[Any] | None = field(default_factory=list)
+    metadata: dict[str, Any] | None = field(default_factory=dict)
+
+
+# Constructing PostgresStorage never connects, so tests that only inspect the
+# configured attributes share one instance per module.
+
+
+@pytest.fixture(scope="module")
+def default_storage():
+    """PostgresStorage with pool settings left to their defaults."""
+    return PostgresStorage(database_url="postgresql://localhost:5432/bindu")
+
+
+@pytest.fixture(scope="module")
+def custom_pool_storage():
+    """PostgresStorage with explicit pool and timeout settings."""
+    return PostgresStorage(
+        database_url="postgresql://localhost:5432/bindu",
+        pool_min=5,
+        pool_max=20,
+        timeout=15,
+        command_timeout=45,
+    )
+
+
+class TestPostgresStorageInit:
+    """Test PostgresStorage construction."""
+
+    def test_init_default_values(self, default_storage):
+        """Test that unset pool options fall back to settings."""
+        assert default_storage.pool_min == app_settings.storage.postgres_pool_min
+        assert default_storage.pool_max == app_settings.storage.postgres_pool_max
+        assert default_storage.timeout == app_settings.storage.postgres_timeout
+        assert (
+            default_storage.command_timeout
+            == app_settings.storage.postgres_command_timeout
+        )
+        assert default_storage.did is None
+        assert default_storage.schema_name is None
+
+    @pytest.mark.parametrize(
+        ("attribute", "expected"),
+        [
+            ("pool_min", 5),
+            ("pool_max", 20),
+            ("timeout", 15),
+            ("command_timeout", 45),
+        ],
+        ids=["pool_min", "pool_max", "timeout", "command_timeout"],
+    )
+    def test_init_custom_pool_settings(self, custom_pool_storage, attribute, expected):
+        """Test that explicit pool options override settings."""
+        assert getattr(custom_pool_storage, attribute) == expected
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("localhost:5432/db", "postgresql+asyncpg://localhost:5432/db"),
+            (
+                "postgresql://localhost:5432/bindu",
+                "postgresql+asyncpg://localhost:5432/bindu",
+            ),
+            ("postgresql+asyncpg://host/db", "postgresql+asyncpg://host/db"),
+            ("postgresql://u:p@h/d", "postgresql+asyncpg://u:p@h/d"),
+            (
+                "postgresql://u:p@h:5432/d?sslmode=require",
+                "postgresql+asyncpg://u:p@h:5432/d?sslmode=require",
+            ),
+            (
+                "postgresql+asyncpg://u:postgresql://@h/d",
+                "postgresql+asyncpg://u:postgresql://@h/d",
+            ),
+        ],
+        ids=[
+            "no_scheme",
+            "postgresql_scheme",
+            "asyncpg_scheme",
+            "credentials",
+            "query_string",
+            "scheme_text_in_password",
+        ],
+    )
+    def test_url_normalization(self, raw, expected):
+        """Test that every accepted URL form ends up on the asyncpg driver."""
+        assert PostgresStorage(database_url=raw).database_url == expected
+
+
+class TestNewTaskId:
+    """Test task ID generation."""
+
+    def test_new_task_ids_are_v7_and_monotonic(self):
+        """Test that IDs are UUIDv7 and sort in creation order."""
+        ids = [PostgresStorage.new_task_id() for _ in range(1000)]
+
+        assert all(task_id.version == 7 for task_id in ids)
+        assert all(task_id.variant == RFC_4122 for task_id in ids)
+        assert sorted(ids) == ids
+        assert len(set(ids)) == len(ids)
+
+    def test_new_task_id_embeds_unix_ms_timestamp(self):
+        """Test that the top 48 bits carry the creation time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        task_id = PostgresStorage.new_task_id()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= task_id.int >> 80 <= after + 1
+
+
+class TestRowToTask:
+    """Test conversion of database rows to Task objects."""
+
+    def test_row_to_task_conversion(self, default_storage):
+        """Test that row columns map onto the Task protocol type."""
+        row = FakeTaskRow(
+            state="working",
+            history=[{"kind": "message"}],
+            artifacts=[{"artifact_id": "a1"}],
+            metadata={"key": "value"},
+        )
+
+        task = default_storage._row_to_task(row)
+
+        assert task["id"] == row.id
+        assert task["context_id"] == row.context_id
+        assert task["kind"] == "task"
+        assert task["status"] == {
+            "state": "working",
+            "timestamp": "2025-01-01T00:00:00+00:00",
+        }
+        assert task["history"] == [{"kind": "message"}]
+        assert task["artifacts"] == [{"artifact_id": "a1"}]
+        assert task["metadata"] == {"key": "value"}
+
+    def test_row_to_task_null_json_columns(self, default_storage):
+        """Test that NULL JSONB columns become empty containers."""
+        row = FakeTaskRow(history=None, artifacts=None, metadata=None)
+
+        task = default_storage._row_to_task(row)
+
+        assert task["history"] == []
+        assert task["artifacts"] == []
+        assert task["metadata"] == {}
+
+
+class TestPostgresStorageConnection:
+    """Test PostgresStorage connection state handling."""
+
+    def test_ensure_connected_raises_when_not_connected(self, default_storage):
+        """Test that operations before connect() fail clearly."""
+        with pytest.raises(RuntimeError, match="connect\\(\\) first"):
+            default_storage._ensure_connected()
+
+    @patch(
+        "bindu.server.storage.postgres_storage.asyncpg.create_pool",
+        new_callable=AsyncMock,
+    )
+    @patch("bindu.server.storage.postgres_storage.async_sessionmaker", autospec=True)
+    @patch("bindu.server.storage.postgres_storage.create_async_engine", autospec=True)
+    async def test_connect_success(self, create_engine, sessionmaker, create_pool):
+        """Test that connect() builds the engine and session factory only."""
+        create_engine.return_value = make_engine_mock()
+        storage = PostgresStorage(database_url="postgresql://localhost:5432/bindu")
+
+        await storage.connect()
+
+        kwargs = create_engine.call_args.kwargs
+        assert kwargs["poolclass"] is AsyncAdaptedQueuePool
+        assert kwargs["pool_pre_ping"] is False
+        assert kwargs["pool_size"] == storage.pool_max
+        assert kwargs["max_overflow"] == 0
+        sessionmaker.assert_called_once()
+        assert storage._engine is create_engine.return_value
+        assert storage._session_factory is sessionmaker.return_value
+        create_pool.assert_not_awaited()
+        assert storage._raw_pool is None
+
+    @patch.object(PostgresStorage, "_ping", autospec=True)
+    @patch("bindu.server.storage.postgres_storage.async_sessionmaker", autospec=True)
+    @patch("bindu.server.storage.postgres_storage.create_async_engine", autospec=True)
+    async def test_connect_warms_pool_min_connections(
+        self, create_engine, sessionmaker, ping
+    ):
+        """Test that connect() opens pool_min connections up front."""
+        create_engine.return_value = make_engine_mock()
+        storage = PostgresStorage(
+            database_url="postgresql://localhost:5432/bindu", pool_min=4
+        )
+
+        await storage.connect()
+
+        assert ping.await_count == 4
+
+    @patch.object(
+        PostgresStorage,
+        "_ping",
+        autospec=True,
+        side_effect=[None, OSError("too many clients")],
+    )
+    @patch("bindu.server.storage.postgres_storage.async_sessionmaker", autospec=True)
+    @patch("bindu.server.storage.postgres_storage.create_async_engine", autospec=True)
+    async def test_connect_tolerates_warm_up_failures(
+        self, create_engine, sessionmaker, ping
+    ):
+        """Test that failing to pre-open connections does not fail connect()."""
+        create_engine.return_value = make_engine_mock()
+        storage = PostgresStorage(
+            database_url="postgresql://localhost:5432/bindu", pool_min=2
+        )
+
+        with patch(
+            "bindu.server.storage.postgres_storage.logger", autospec=True
+        ) as logger:
+            await storage.connect()
+
+        assert storage._engine is create_engine.return_value
+        (message,) = logger.warning.call_args.args
+        assert "1/2" in message
+        assert "too many clients" in message
+
+    async def test_ping_round_trips_on_pooled_connection(self):
+        """Test that _ping checks out a connection and runs a query on it."""
+        storage = PostgresStorage(database_url="postgresql://localhost:5432/bindu")
+        storage._engine = make_engine_mock()
+
+        await storage._ping()
+
+        connection = storage._engine.connect.return_value.__aenter__.return_value
+        connection.execute.assert_awaited_once()
+
+    @patch("bindu.server.storage.postgres_storage.async_sessionmaker", autospec=True)
+    @patch("bindu.server.storage.postgres_storage.create_async_engine", autospec=True)
+    async def test_connect_failure(self, create_engine, sessionmaker):
+        """Test that a failing connection check surfaces as ConnectionError."""
+        create_engine.return_value = make_engine_mock(OSError("refused"))
+        storage = PostgresStorage(database_url="postgresql://localhost:5432/bindu")
+
+        with pytest.raises(ConnectionError, match="refused"):
+            await storage.connect()
+
+    @patch("bindu.server.storage.postgres_storage.async_sessionmaker", autospec=True)
+    @patch("bindu.server.storage.postgres_storage.create_async_engine", autospec=True)
+    async def test_disconnect(self, create_engine, sessionmaker):
+        """Test that close() disposes the engine and closes the raw pool."""
+        calls = {"dispose": 0, "pool_close": 0}
+
+        async def dispose():
+            calls["dispose"] += 1
+
+        async def pool_close():
+            calls["pool_close"] += 1
+
+        engine = create_engine.return_value = make_engine_mock()
+        engine.dispose = dispose
+        storage = PostgresStorage(database_url="postgresql://localhost:5432/bindu")
+        await storage.connect()
+        storage._raw_pool = MagicMock(close=pool_close)
+
+        await storage.close()
+
+        assert calls == {"dispose": 1, "pool_close": 1}
+        assert storage._engine is None
+        assert storage._session_factory is None
+        assert storage._raw_pool is None
+
+
+def _connected_storage(owner_rows):
+    """Build a storage whose session factory yields a mocked session.
+
+    Args:
+        owner_rows: (context_id, owner_did) rows returned by the ownership query
+
+    Returns:
+        Tuple of (storage, asyncpg driver connection mock)
+    """
+    driver_connection = AsyncMock()
+    connection = AsyncMock()
+    connection.get_raw_connection.return_value = MagicMock(
+        driver_connection=driver_connection
+    )
+
+    session = AsyncMock()
+    session.__aenter__.return_value = session
+    session.begin = MagicMock(return_value=AsyncMock())
+    session.connection.return_value = connection
+    session.execute.return_value = MagicMock(all=MagicMock(return_value=owner_rows))
+
+    storage = PostgresStorage(database_url="postgresql://localhost:5432/bindu")
+    storage._engine = MagicMock()
+    storage._session_factory = MagicMock(return_value=session)
+    return storage, driver_connection
+
+
+class TestJsonbBinaryCodec:
+    """Test the jsonb codec registered on raw asyncpg connections."""
+
+    async def test_registers_binary_jsonb_codec(self):
+        """Test that jsonb is registered in binary format on pg_catalog."""
+        connection = AsyncMock()
+
+        await _register_jsonb_codec(connection)
+
+        connection.set_type_codec.assert_awaited_once_with(
+            "jsonb",
+            encoder=_encode_jsonb_binary,
+            decoder=_decode_jsonb_binary,
+            schema="pg_catalog",
+            format="binary",
+        )
+
+    def test_binary_codec_passes_bytes_through(self):
+        """Test that the encoder emits versioned bytes the decoder reads back."""
+        value = {"id": uuid4(), "parts": [{"kind": "text", "text": "hi"}]}
+
+        encoded = _encode_jsonb_binary(value)
+
+        assert isinstance(encoded, bytes)
+        assert encoded[:1] == b"\x01"
+        assert _decode_jsonb_binary(encoded) == {
+            "id": str(value["id"]),
+            "parts": [{"kind": "text", "text": "hi"}],
+        }
+
+
+class TestRetryOnConnectionError:
+    """Test the retry wrapper around storage operations."""
+
+    @pytest.fixture
+    def retrying(self, monkeypatch):
+        """Spy on AsyncRetrying with backoff sleeps that return immediately.
+
+        Returns:
+            Tuple of (AsyncRetrying spy, list of requested backoff delays)
+        """
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        spy = MagicMock(wraps=partial(AsyncRetrying, sleep=fake_sleep))
+        monkeypatch.setattr("bindu.server.storage.postgres_storage.AsyncRetrying", spy)
+        return spy, delays
+
+    async def test_uses_tenacity_jittered_backoff(self, default_storage, retrying):
+        """Test that retries go through AsyncRetrying with jittered backoff."""
+        spy, delays = retrying
+        func = AsyncMock(
+            side_effect=[OperationalError("SELECT 1", {}, Exception("gone")), "ok"]
+        )
+
+        assert await default_storage._retry_on_connection_error(func) == "ok"
+
+        assert spy.called
+        kwargs = spy.call_args.kwargs
+        assert isinstance(kwargs["wait"], wait_exponential_jitter)
+        assert isinstance(kwargs["stop"], stop_after_attempt)
+        assert kwargs["stop"].max_attempt_number == (
+            app_settings.storage.postgres_max_retries
+        )
+        assert func.await_count == 2
+        assert len(delays) == 1
+
+    async def test_max_retries_exceeded(self, default_storage, retrying):
+        """Test that the last connection error is re-raised after all attempts."""
+        _, delays = retrying
+        func = AsyncMock(side_effect=ConnectionError("refused"))
+
+        with pytest.raises(ConnectionError, match="refused"):
+            await default_storage._retry_on_connection_error(func)
+
+        max_retries = app_settings.storage.postgres_max_retries
+        assert func.await_count == max_retries
+        assert len(delays) == max_retries - 1
+
+    async def test_does_not_retry_application_errors(self, default_storage, retrying):
+        """Test that non-transient errors fail on the first attempt."""
+        func = AsyncMock(side_effect=ValueError("terminal state"))
+
+        with pytest.raises(ValueError):
+            await default_storage._retry_on_connection_error(func)
+
+        assert func.await_count == 1
+
+
+def _raw_pool_storage(row):
+    """Build a connected storage whose raw pool returns ``row`` from fetchrow.
+
+    Args:
+        row: Record-like mapping returned by fetchrow, or None
+
+    Returns:
+        PostgresStorage with mocked engine, session factory and raw pool
+    """
+    storage = PostgresStorage(database_url="postgresql://localhost:5432/bindu")
+    storage._engine = MagicMock()
+    storage._session_factory = MagicMock()
+    storage._raw_pool = MagicMock(fetchrow=AsyncMock(return_value=row))
+    return storage
+
+
+class TestPostgresStorageTaskOperations:
+    """Test task operations against a mocked session."""
+
+    @pytest.mark.parametrize(
+        "context_id",
+        [None, 123, "not-a-uuid"],
+        ids=["none", "int", "malformed_str"],
+    )
+    async def test_submit_task_invalid_context_type(self, default_storage, context_id):
+        """Test that a bad context_id is rejected before the message is used."""
+        with pytest.raises(TypeError, match="context_id"):
+            await default_storage.submit_task(context_id, SAMPLE_MESSAGE)
+
+    async def test_submit_tasks_bulk_uses_single_copy(self):
+        """Test that N tasks are written with one COPY instead of N inserts."""
+        context_id = uuid4()
+        items = [
+            (context_id, create_test_message(context_id=context_id)) for _ in range(3)
+        ]
+        storage, driver_connection = _connected_storage([(context_id, "did:caller")])
+
+        tasks = await storage.submit_tasks_bulk(items, caller_did="did:caller")
+
+        driver_connection.copy_records_to_table.assert_awaited_once()
+        call = driver_connection.copy_records_to_table.await_args
+        assert call.args == ("tasks",)
+        assert call.kwargs["columns"] == BULK_TASK_COLUMNS
+        assert len(call.kwargs["records"]) == 3
+        assert [task["id"] for task in tasks] == [
+            message["task_id"] for _, message in items
+        ]
+        assert all(task["status"]["state"] == "submitted" for task in tasks)
+        # History comes back decoded from the stored JSON, as load_task returns it
+        assert tasks[0]["history"][0]["task_id"] == str(items[0][1]["task_id"])
+
+    async def test_submit_tasks_bulk_rejects_foreign_context(self):
+        """Test that the batch fails before COPY if a context has another owner."""
+        context_id = uuid4()
+        storage, driver_connection = _connected_storage([(context_id, "did:other")])
+
+        with pytest.raises(OwnershipError):
+            await storage.submit_tasks_bulk(
+                [(context_id, create_test_message(context_id=context_id))],
+                caller_did="did:caller",
+            )
+
+        driver_connection.copy_records_to_table.assert_not_called()
+
+    async def test_submit_tasks_bulk_empty(self, default_storage):
+        """Test that an empty batch is a no-op that needs no connection."""
+        assert await default_storage.submit_tasks_bulk([]) == []
+
+    async def test_load_task_raw_uses_fetchrow_without_session(self):
+        """Test that load_task_raw is one fetchrow and never opens a session."""
+        row = {
+            "id": uuid4(),
+            "context_id": uuid4(),
+            "kind": "task",
+            "state": "completed",
+            "state_timestamp": datetime(2025, 1, 1, tzinfo=UTC),
+            "history": [{"kind": "message"}],
+            "artifacts": None,
+            "metadata": {"key": "value"},
+        }
+        storage = _raw_pool_storage(row)
+
+        task = await storage.load_task_raw(row["id"])
+
+        storage._raw_pool.fetchrow.assert_awaited_once_with(
+            LOAD_TASK_RAW_QUERY, row["id"]
+        )
+        storage._session_factory.assert_not_called()
+        assert task["id"] == row["id"]
+        assert task["status"]["state"] == "completed"
+        assert task["history"] == [{"kind": "message"}]
+        assert task["artifacts"] == []
+        assert task["metadata"] == {"key": "value"}
+
+    async def test_load_task_raw_history_length(self):
+        """Test that history_length keeps only the most recent messages."""
+        row = {
+            "id": uuid4(),
+            "context_id": uuid4(),
+            "kind": "task",
+            "state": "working",
+            "state_timestamp": datetime(2025, 1, 1, tzinfo=UTC),
+            "history": [{"n": 1}, {"n": 2}, {"n": 3}],
+            "artifacts": None,
+            "metadata": None,
+        }
+        storage = _raw_pool_storage(row)
+
+        task = await storage.load_task_raw(row["id"], history_length=2)
+
+        assert task["history"] == [{"n": 2}, {"n": 3}]
+
+    async def test_load_task_raw_not_found(self):
+        """Test that a missing task returns None."""
+        storage = _raw_pool_storage(None)
+
+        assert await storage.load_task_raw(uuid4()) is None
+
+    @patch(
+        "bindu.server.storage.postgres_storage.asyncpg.create_pool",
+        new_callable=AsyncMock,
+    )
+    async def test_raw_pool_opened_lazily_and_capped(self, create_pool):
+        """Test that the raw pool is created once, on first use, with no idle floor."""
+        create_pool.return_value.fetchrow = AsyncMock(return_value=None)
+        storage = PostgresStorage(
+            database_url="postgresql://localhost:5432/bindu",
+            did="did:bindu:test",
+        )
+        storage._engine = MagicMock()
+        storage._session_factory = MagicMock()
+
+        await storage.load_task_raw(uuid4())
+        await storage.load_task_raw(uuid4())
+
+        create_pool.assert_awaited_once()
+        call = create_pool.await_args
+        assert call.args == ("postgresql://localhost:5432/bindu",)
+        assert call.kwargs["min_size"] == 0
+        assert call.kwargs["max_size"] == app_settings.storage.postgres_raw_pool_max
+        assert call.kwargs["init"] is _register_jsonb_codec
+        assert call.kwargs["server_settings"] == {
+            "search_path": f'"{storage.schema_name}"'
+        }
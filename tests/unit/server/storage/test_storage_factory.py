@@ -10,7 +10,6 @@ from bindu.server.storage.memory_storage import InMemoryStorage
 class TestStorageFactory:
     """Test storage factory functionality."""
 
-    @pytest.mark.asyncio
     async def test_create_memory_storage(self):
         """Test creating memory storage from settings."""
         with patch("bindu.server.storage.factory.app_settings") as mock_settings:
@@ -20,7 +19,6 @@ class TestStorageFactory:
 
             assert isinstance(storage, InMemoryStorage)
 
-    @pytest.mark.asyncio
     async def test_create_storage_invalid_backend_raises(self):
         """Test that invalid backend raises ValueError."""
         with patch("bindu.server.storage.factory.app_settings") as mock_settings:
@@ -29,7 +27,6 @@ class TestStorageFactory:
             with pytest.raises(ValueError, match="Unknown storage backend"):
                 await create_storage()
 
-    @pytest.mark.asyncio
     async def test_create_postgres_storage_without_sqlalchemy_raises(self):
         """Test that Postgres storage without SQLAlchemy raises error."""
         with patch("bindu.server.storage.factory.app_settings") as mock_settings:
@@ -39,7 +36,6 @@ class TestStorageFactory:
                 with pytest.raises(ValueError, match="requires SQLAlchemy"):
                     await create_storage()
 
-    @pytest.mark.asyncio
     async def test_create_postgres_storage_without_url_raises(self):
         """Test that Postgres storage without URL raises error."""
         with patch("bindu.server.storage.factory.app_settings") as mock_settings:
@@ -50,7 +46,6 @@ class TestStorageFactory:
                 with pytest.raises(ValueError, match="requires a database URL"):
                     await create_storage()
 
-    @pytest.mark.asyncio
     async def test_close_storage(self):
         """Test closing storage gracefully."""
         mock_storage = AsyncMock()
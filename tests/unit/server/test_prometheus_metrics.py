@@ -0,0 +1,292 @@
+"""Tests for Prometheus metrics collection."""
+
+import sys
+import threading
+
+import pytest
+
+from bindu.server.metrics import PrometheusMetrics
+
+
+class TestPrometheusMetrics:
+    """Test PrometheusMetrics recording and text generation."""
+
+    def test_record_http_request_counter(self):
+        """Test that HTTP requests are counted per label set."""
+        metrics = PrometheusMetrics()
+
+        metrics.record_http_request("GET", "/health", "200", 0.05)
+        metrics.record_http_request("GET", "/health", "200", 0.05)
+        metrics.record_http_request("POST", "/", "500", 0.2)
+
+        text = metrics.generate_prometheus_text()
+
+        assert (
+            'http_requests_total{method="GET",endpoint="/health",status="200"} 2'
+            in text
+        )
+        assert 'http_requests_total{method="POST",endpoint="/",status="500"} 1' in text
+
+    def test_record_http_request_reuses_cached_label(self):
+        """Test that repeated label sets reuse the pre-formatted label string."""
+        metrics = PrometheusMetrics()
+
+        metrics.record_http_request("GET", "/health", "200", 0.05)
+        metrics.record_http_request("GET", "/health", "200", 0.05)
+
+        assert metrics._http_request_label_ids == {("GET", "/health", "200"): 0}
+        assert metrics._http_request_labels == [
+            'method="GET",endpoint="/health",status="200"'
+        ]
+
+    def test_record_http_request_interns_label_components(self):
+        """Test that cached label keys hold interned strings."""
+        metrics = PrometheusMetrics()
+        endpoint = "".join(["/tasks/", ":id"])
+
+        metrics.record_http_request("GET", endpoint, "200", 0.05)
+
+        (key,) = metrics._http_request_label_ids
+        assert key[1] is sys.intern("/tasks/:id")
+
+    def test_record_http_request_accepts_int_status(self):
+        """Test that a non-str status is labelled like its string form."""
+        metrics = PrometheusMetrics()
+
+        metrics.record_http_request("GET", "/health", 200, 0.05)
+        metrics.record_http_request("GET", "/health", "200", 0.05)
+
+        assert metrics._http_request_label_ids == {("GET", "/health", "200"): 0}
+        assert (
+            'http_requests_total{method="GET",endpoint="/health",status="200"} 2'
+            in metrics.generate_prometheus_text()
+        )
+
+    def test_record_http_request_counts_by_label_id(self):
+        """Test that shards count requests in arrays indexed by label id."""
+        metrics = PrometheusMetrics()
+
+        metrics.record_http_request("GET", "/health", "200", 0.05)
+        metrics.record_http_request("POST", "/", "200", 0.05)
+        metrics.record_http_request("POST", "/", "200", 0.05)
+
+        (shard,) = metrics._http_shards
+        assert shard.requests.tolist() == [1, 2]
+
+    def test_generate_prometheus_bytes_matches_text(self):
+        """Test that the bytes variant is the encoded text exposition."""
+        metrics = PrometheusMetrics()
+        metrics.record_http_request("GET", "/health", "200", 0.05, 10, 20)
+
+        body = metrics.generate_prometheus_bytes()
+
+        assert isinstance(body, bytes)
+        assert body.decode() == metrics.generate_prometheus_text()
+        assert body.endswith(b"\n")
+
+    def test_record_http_requests_batch_matches_single_records(self):
+        """Test that batch recording produces the same output as single records."""
+        rows = [
+            ("GET", "/health", "200", 0.05),
+            ("GET", "/health", "200", 0.5),
+            ("POST", "/", "500", 0.7),
+            ("POST", "/", "500", 3.0),
+        ]
+        single = PrometheusMetrics()
+        for row in rows:
+            single.record_http_request(*row)
+
+        batched = PrometheusMetrics()
+        batched.record_http_requests_batch(rows)
+        batched.record_http_requests_batch([])
+
+        assert batched.generate_prometheus_text() == single.generate_prometheus_text()
+
+    def test_nan_duration_counts_request_but_not_histogram(self):
+        """Test that NaN durations are counted as requests but not observed."""
+        rows = [
+            ("GET", "/health", "200", 0.05),
+            ("GET", "/health", "200", float("nan")),
+        ]
+        single = PrometheusMetrics()
+        for row in rows:
+            single.record_http_request(*row)
+
+        batched = PrometheusMetrics()
+        before = batched.generate_prometheus_bytes()
+        batched.record_http_requests_batch(rows)
+        text = batched.generate_prometheus_text()
+
+        assert batched.generate_prometheus_bytes() is not before
+        assert text == single.generate_prometheus_text()
+        assert (
+            'http_requests_total{method="GET",endpoint="/health",status="200"} 2'
+            in text
+        )
+        assert "http_request_duration_seconds_count 1" in text
+        assert "nan" not in text
+
+    def test_record_http_requests_batch_rejects_bad_row_without_writing(self):
+        """Test that a batch failing on a bad label leaves no partial write."""
+
+        class Unlabelable:
+            def __str__(self):
+                raise ValueError("no label")
+
+        metrics = PrometheusMetrics()
+        metrics.record_http_request("GET", "/a", "200", 0.1)
+        before = metrics.generate_prometheus_bytes()
+
+        with pytest.raises(ValueError):
+            metrics.record_http_requests_batch(
+                [("GET", "/a", "200", 0.1), ("GET", "/b", Unlabelable(), 0.1)]
+            )
+
+        (shard,) = metrics._http_shards
+        assert shard.requests.tolist() == [1]
+        assert shard.duration_count == 1
+        assert metrics.generate_prometheus_bytes() == before
+
+        metrics.record_http_requests_batch([("GET", "/a", "200", 0.1)])
+        assert (
+            b'http_requests_total{method="GET",endpoint="/a",status="200"} 2'
+            in metrics.generate_prometheus_bytes()
+        )
+
+    def test_scrape_output_cached_until_next_write(self):
+        """Test that scrapes reuse the previous output until a metric changes."""
+        metrics = PrometheusMetrics()
+        metrics.record_http_request("GET", "/health", "200", 0.05)
+
+        first = metrics.generate_prometheus_bytes()
+        assert metrics.generate_prometheus_bytes() is first
+
+        # Re-setting an unchanged gauge is not a write
+        metrics.set_agent_tasks_active("agent-1", 1)
+        second = metrics.generate_prometheus_bytes()
+        assert second is not first
+        metrics.set_agent_tasks_active("agent-1", 1)
+        assert metrics.generate_prometheus_bytes() is second
+
+        metrics.record_http_request("GET", "/health", "200", 0.05)
+        third = metrics.generate_prometheus_bytes()
+        assert third is not second
+        assert (
+            b'http_requests_total{method="GET",endpoint="/health",status="200"} 2'
+            in third
+        )
+
+    def test_metrics_histogram_buckets(self):
+        """Test that duration histogram buckets are cumulative."""
+        metrics = PrometheusMetrics()
+
+        metrics.record_http_request("GET", "/", "200", 0.05)
+        metrics.record_http_request("GET", "/", "200", 0.3)
+        metrics.record_http_request("GET", "/", "200", 2.0)
+
+        text = metrics.generate_prometheus_text()
+
+        assert 'http_request_duration_seconds_bucket{le="0.1"} 1' in text
+        assert 'http_request_duration_seconds_bucket{le="0.5"} 2' in text
+        assert 'http_request_duration_seconds_bucket{le="1.0"} 2' in text
+        assert 'http_request_duration_seconds_bucket{le="+Inf"} 3' in text
+        assert "http_request_duration_seconds_count 3" in text
+
+    def test_task_duration_histogram_buckets(self):
+        """Test that task duration buckets are cumulative per agent and status."""
+        metrics = PrometheusMetrics()
+
+        metrics.record_task_duration("agent-1", "success", 1.0)
+        metrics.record_task_duration("agent-1", "success", 20.0)
+
+        text = metrics.generate_prometheus_text()
+
+        labels = 'agent_id="agent-1",status="success"'
+        assert f'task_duration_seconds_bucket{{{labels},le="1.0"}} 1' in text
+        assert f'task_duration_seconds_bucket{{{labels},le="10.0"}} 1' in text
+        assert f'task_duration_seconds_bucket{{{labels},le="30.0"}} 2' in text
+        assert f'task_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"task_duration_seconds_count{{{labels}}} 2" in text
+
+    def test_nan_task_duration_is_not_observed(self):
+        """Test that NaN task durations leave buckets and sum untouched."""
+        metrics = PrometheusMetrics()
+
+        metrics.record_task_duration("agent-1", "success", 1.0)
+        metrics.record_task_duration("agent-1", "success", float("nan"))
+
+        text = metrics.generate_prometheus_text()
+
+        labels = 'agent_id="agent-1",status="success"'
+        assert f'task_duration_seconds_bucket{{{labels},le="1.0"}} 1' in text
+        assert f'task_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+        assert f"task_duration_seconds_sum{{{labels}}} 1.0" in text
+        assert f"task_duration_seconds_count{{{labels}}} 1" in text
+        assert "nan" not in text
+
+    def test_metrics_headers(self):
+        """Test that HELP and TYPE lines are emitted."""
+        metrics = PrometheusMetrics()
+
+        text = metrics.generate_prometheus_text()
+
+        assert "# HELP http_requests_total Total number of HTTP requests" in text
+        assert "# TYPE http_requests_total counter" in text
+        assert "# TYPE http_request_duration_seconds histogram" in text
+        assert text.endswith("\n")
+
+    def test_agent_task_metrics(self):
+        """Test agent task gauges and counters."""
+        metrics = PrometheusMetrics()
+
+        metrics.set_agent_tasks_active("agent-1", 3)
+        metrics.increment_agent_tasks_completed("agent-1", "success")
+        metrics.increment_agent_tasks_completed("agent-1", "success")
+
+        text = metrics.generate_prometheus_text()
+
+        assert 'agent_tasks_active{agent_id="agent-1"} 3' in text
+        assert (
+            'agent_tasks_completed_total{agent_id="agent-1",status="success"} 2' in text
+        )
+
+    def test_record_http_request_uses_per_thread_shards(self):
+        """Test that each recording thread gets its own shard, summed on scrape."""
+        metrics = PrometheusMetrics()
+
+        metrics.record_http_request("GET", "/test", "200", 0.1)
+        thread = threading.Thread(
+            target=metrics.record_http_request, args=("GET", "/test", "200", 0.1)
+        )
+        thread.start()
+        thread.join()
+
+        assert len(metrics._http_shards) == 2
+        text = metrics.generate_prometheus_text()
+        assert (
+            'http_requests_total{method="GET",endpoint="/test",status="200"} 2' in text
+        )
+
+    def test_metrics_thread_safety(self):
+        """Test that concurrent recording does not lose updates."""
+        metrics = PrometheusMetrics()
+
+        barrier = threading.Barrier(5)
+
+        def record_requests():
+            # Release all threads at once so their writes actually overlap
+            barrier.wait()
+            for _ in range(10):
+                metrics.record_http_request("GET", "/test", "200", 0.1)
+
+        threads = [threading.Thread(target=record_requests) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        text = metrics.generate_prometheus_text()
+
+        assert (
+            'http_requests_total{method="GET",endpoint="/test",status="200"} 50' in text
+        )
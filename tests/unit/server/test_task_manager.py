@@ -1,7 +1,6 @@
 """Minimal tests for TaskManager."""
 
 from unittest.mock import AsyncMock, Mock
-import pytest
 
 from bindu.server.task_manager import TaskManager
 
@@ -34,7 +33,6 @@ class TestTaskManager:
 
         assert manager.manifest == mock_manifest
 
-    @pytest.mark.asyncio
     async def test_task_manager_context_manager(self):
         """Test TaskManager async context manager."""
         mock_scheduler = AsyncMock()
@@ -51,7 +49,6 @@ class TestTaskManager:
 
         mock_scheduler.__aenter__.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_push_manager_initialization(self):
         """Test push manager is initialized."""
         mock_scheduler = Mock()
@@ -64,7 +61,6 @@ class TestTaskManager:
         assert manager._push_manager is not None
         assert manager._push_manager.storage == mock_storage
 
-    @pytest.mark.asyncio
     async def test_context_manager_calls_scheduler_exit(self):
         """Test that context manager exit calls scheduler exit."""
         mock_scheduler = AsyncMock()
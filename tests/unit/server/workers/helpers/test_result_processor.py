@@ -1,14 +1,11 @@
 """Minimal tests for result processor."""
 
-import pytest
-
 from bindu.server.workers.helpers.result_processor import ResultProcessor
 
 
 class TestResultProcessor:
     """Test result processor functionality."""
 
-    @pytest.mark.asyncio
     async def test_collect_results_with_direct_value(self):
         """Test collecting direct return value."""
         result = "Direct response"
@@ -17,7 +14,6 @@ class TestResultProcessor:
 
         assert collected == "Direct response"
 
-    @pytest.mark.asyncio
     async def test_collect_results_with_dict(self):
         """Test collecting dict result."""
         result = {"message": "Hello", "data": 123}
@@ -26,7 +22,6 @@ class TestResultProcessor:
 
         assert collected == {"message": "Hello", "data": 123}
 
-    @pytest.mark.asyncio
     async def test_collect_results_with_async_generator(self):
         """Test collecting from async generator."""
 
@@ -39,7 +34,6 @@ class TestResultProcessor:
 
         assert collected == "chunk3"
 
-    @pytest.mark.asyncio
     async def test_collect_results_with_sync_generator(self):
         """Test collecting from sync generator."""
 
@@ -52,7 +46,6 @@ class TestResultProcessor:
 
         assert collected == "item3"
 
-    @pytest.mark.asyncio
     async def test_collect_results_with_empty_async_generator(self):
         """Test collecting from empty async generator."""
 
@@ -99,7 +92,6 @@ class TestResultProcessor:
         # None is converted to empty string
         assert normalized == ""
 
-    @pytest.mark.asyncio
     async def test_collect_results_with_empty_sync_generator(self):
         """Test collecting from empty sync generator."""
 
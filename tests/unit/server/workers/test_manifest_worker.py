@@ -52,7 +52,6 @@ class TestManifestWorker:
         assert len(artifacts) > 0
         assert "parts" in artifacts[0]
 
-    @pytest.mark.asyncio
     async def test_handle_task_failure(self):
         """Test handling task failure."""
         mock_manifest = Mock()
@@ -79,7 +78,6 @@ class TestManifestWorker:
         assert call_args[0][0] == task["id"]
         assert call_args[1]["state"] == "failed"
 
-    @pytest.mark.asyncio
     async def test_notify_lifecycle_with_callback(self):
         """Test lifecycle notification with callback."""
         mock_manifest = Mock()
@@ -101,7 +99,6 @@ class TestManifestWorker:
 
         mock_callback.assert_called_once_with(task_id, context_id, "completed", True)
 
-    @pytest.mark.asyncio
     async def test_notify_lifecycle_without_callback(self):
         """Test lifecycle notification without callback."""
         mock_manifest = Mock()
@@ -118,7 +115,6 @@ class TestManifestWorker:
         # Should not raise error
         await worker._notify_lifecycle(task_id, context_id, "completed", True)
 
-    @pytest.mark.asyncio
     async def test_settle_payment_handles_missing_context(self):
         """Test payment settlement with missing context returns error."""
         mock_manifest = Mock()
@@ -167,7 +163,6 @@ class TestManifestWorker:
         # Should not raise error
         worker._log_notification_error("Artifact", task_id, context_id, error)
 
-    @pytest.mark.asyncio
     async def test_cancel_task(self):
         """Test canceling a task."""
         mock_manifest = Mock()
@@ -191,7 +186,6 @@ class TestManifestWorker:
 
         mock_storage.update_task.assert_called_once_with(task_id, state="canceled")
 
-    @pytest.mark.asyncio
     async def test_cancel_task_not_found(self):
         """Test canceling a task that doesn't exist."""
         mock_manifest = Mock()
@@ -208,7 +202,6 @@ class TestManifestWorker:
 
         mock_storage.update_task.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_build_complete_message_history_with_references(self):
         """Test building message history with reference task IDs."""
         mock_manifest = Mock()
@@ -252,7 +245,6 @@ class TestManifestWorker:
         assert isinstance(history, list)
         mock_storage.load_task.assert_called()
 
-    @pytest.mark.asyncio
     async def test_build_complete_message_history_without_references(self):
         """Test building message history without reference task IDs."""
         mock_manifest = Mock()
@@ -282,7 +274,6 @@ class TestManifestWorker:
 
         assert isinstance(history, list)
 
-    @pytest.mark.asyncio
     async def test_settle_payment_with_valid_context(self):
         """Test payment settlement with valid payment context."""
         mock_manifest = Mock()
@@ -302,7 +293,6 @@ class TestManifestWorker:
 
         assert result is not None
 
-    @pytest.mark.asyncio
     async def test_handle_intermediate_state(self):
         """Test handling intermediate task state."""
         mock_manifest = Mock()
@@ -330,7 +320,6 @@ class TestManifestWorker:
 
         mock_storage.update_task.assert_called()
 
-    @pytest.mark.asyncio
     async def test_handle_terminal_state(self):
         """Test handling terminal task state."""
         mock_manifest = Mock()
@@ -358,7 +347,6 @@ class TestManifestWorker:
 
         mock_storage.update_task.assert_called()
 
-    @pytest.mark.asyncio
     async def test_handle_terminal_state_with_payment(self):
         """Test handling terminal state with payment settlement."""
         mock_manifest = Mock()
@@ -415,7 +403,6 @@ class TestManifestWorker:
 
         worker._add_state_change_event("completed")
 
-    @pytest.mark.asyncio
     async def test_run_task_basic_flow(self):
         """Test basic task execution flow."""
         mock_manifest = Mock()
@@ -452,7 +439,6 @@ class TestManifestWorker:
         mock_storage.update_task.assert_called()
         mock_manifest.run.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_run_task_with_input_required_response(self):
         """Test task execution with input-required response."""
         mock_manifest = Mock()
@@ -490,7 +476,6 @@ class TestManifestWorker:
 
         mock_storage.update_task.assert_called()
 
-    @pytest.mark.asyncio
     async def test_run_task_with_auth_required_response(self):
         """Test task execution with auth-required response."""
         mock_manifest = Mock()
@@ -528,7 +513,6 @@ class TestManifestWorker:
 
         mock_storage.update_task.assert_called()
 
-    @pytest.mark.asyncio
     async def test_run_task_with_payment_context(self):
         """Test task execution with payment context."""
         mock_manifest = Mock()
@@ -572,7 +556,6 @@ class TestManifestWorker:
 
         mock_storage.update_task.assert_called()
 
-    @pytest.mark.asyncio
     async def test_run_task_not_found(self):
         """Test task execution when task doesn't exist."""
         mock_manifest = Mock()
@@ -589,7 +572,6 @@ class TestManifestWorker:
         with pytest.raises(ValueError, match="not found"):
             await worker.run_task(params)
 
-    @pytest.mark.asyncio
     async def test_run_task_with_agent_error(self):
         """Test task execution when agent raises error."""
         mock_manifest = Mock()
@@ -630,7 +612,6 @@ class TestManifestWorker:
             for call in mock_storage.update_task.call_args_list
         )
 
-    @pytest.mark.asyncio
     async def test_run_task_with_system_message(self):
         """Test task execution with system message enabled."""
         from unittest.mock import patch
@@ -677,7 +658,6 @@ class TestManifestWorker:
 
         mock_manifest.run.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_run_task_with_context_based_history(self):
         """Test task execution with context-based history."""
         mock_manifest = Mock()
@@ -721,7 +701,6 @@ class TestManifestWorker:
 
         mock_storage.list_tasks_by_context.assert_called_once_with(context_id)
 
-    @pytest.mark.asyncio
     async def test_settle_payment_with_facilitator(self):
         """Test payment settlement with facilitator client."""
         from unittest.mock import patch
@@ -750,7 +729,6 @@ class TestManifestWorker:
 
             assert result is not None
 
-    @pytest.mark.asyncio
     async def test_build_complete_message_history_with_context_disabled(self):
         """Test building message history with context-based history disabled."""
         mock_manifest = Mock()
@@ -502,3 +502,17 @@ class TestConfigImmutability:
         assert "storage" in result
         # Original should not have storage
         assert "storage" not in original_config
+
+    def test_environment_read_fresh_on_each_call(self):
+        """Test that each call sees the current environment, not a stale snapshot."""
+        with patch.dict(os.environ, {"STORAGE_TYPE": "memory"}):
+            first = load_config_from_env({})
+
+        with patch.dict(
+            os.environ,
+            {"STORAGE_TYPE": "postgres", "DATABASE_URL": "postgresql://db/test"},
+        ):
+            second = load_config_from_env({})
+
+        assert first["storage"] == {"type": "memory"}
+        assert second["storage"]["type"] == "postgres"
@@ -164,7 +164,6 @@ class TestNotificationService:
 
         assert "authentication" in str(headers).lower() or "Content-Type" in headers
 
-    @pytest.mark.asyncio
     async def test_send_event_success(self):
         """Test successfully sending an event."""
         service = NotificationService()
@@ -181,7 +180,6 @@ class TestNotificationService:
 
         assert service.total_sent > 0
 
-    @pytest.mark.asyncio
     async def test_send_event_delivery_error(self):
         """Test handling delivery error."""
         service = NotificationService()
@@ -1,51 +1,250 @@
 """Tests for retry utilities."""
 
+import asyncio
+from functools import partial
+
 import pytest
+from tenacity import AsyncRetrying
+
+from bindu.settings import app_settings
+from bindu.utils.retry import (
+    _RETRYABLE_EXCEPTIONS,
+    TRANSIENT_EXCEPTIONS,
+    create_retry_decorator,
+    execute_with_retry,
+    is_retryable_error,
+    retry_api_call,
+    retry_scheduler_operation,
+    retry_storage_operation,
+    retry_worker_operation,
+)
+
+
+# Built once at import; the parametrized cases below only read them
+_CONN_ERR = ConnectionError("test")
+_TIMEOUT = TimeoutError("test")
+_AIO_TIMEOUT = asyncio.TimeoutError()
+_BROKEN_PIPE = BrokenPipeError("test")
+_VALUE_ERR = ValueError("test")
+_KEY_ERR = KeyError("test")
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make retry backoff return immediately instead of sleeping.
+
+    Hands a no-op sleep to the AsyncRetrying used by bindu.utils.retry, so
+    asyncio.sleep itself is never patched.
+
+    Returns:
+        List of the requested backoff delays, one entry per retry
+    """
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(
+        "bindu.utils.retry.AsyncRetrying", partial(AsyncRetrying, sleep=fake_sleep)
+    )
+    return delays
+
+
+@pytest.fixture(scope="module")
+def retry_cfg():
+    """Retry settings, looked up once per module."""
+    return app_settings.retry
+
+
+def _failing(times, exc_type=ConnectionError):
+    """Build an async function that fails ``times`` times before succeeding.
+
+    Args:
+        times: Number of initial calls that raise
+        exc_type: Exception type to raise
 
-from bindu.utils.retry import create_retry_decorator
+    Returns:
+        Tuple of (async function, list recording one entry per call)
+    """
+    calls = []
+
+    async def func():
+        calls.append(None)
+        if len(calls) <= times:
+            raise exc_type("transient")
+        return "success"
+
+    return func, calls
 
 
 class TestRetryDecorators:
     """Test retry decorator functionality."""
 
-    @pytest.mark.asyncio
-    async def test_create_retry_decorator_storage(self):
-        """Test creating storage retry decorator."""
+    @pytest.mark.parametrize(
+        "operation_type", ["worker", "storage", "scheduler", "api"]
+    )
+    async def test_create_retry_decorator(self, operation_type):
+        """Test creating a retry decorator for each operation type."""
         decorator = create_retry_decorator(
-            "storage", max_attempts=3, min_wait=0.1, max_wait=1.0
+            operation_type, max_attempts=3, min_wait=0.1, max_wait=1.0
         )
 
         @decorator
+        async def test_func(value):
+            return value * 2
+
+        result = await test_func(21)
+        assert result == 42
+
+    def test_create_retry_decorator_invalid_type(self):
+        """Test that unknown operation types are rejected."""
+        with pytest.raises(ValueError, match="Invalid operation_type"):
+            create_retry_decorator("unknown")
+
+    @pytest.mark.parametrize(
+        "decorator",
+        [
+            retry_worker_operation,
+            retry_storage_operation,
+            retry_scheduler_operation,
+            retry_api_call,
+        ],
+    )
+    async def test_decorator_success(self, decorator):
+        """Test that each convenience decorator passes results through."""
+
+        @decorator(max_attempts=3, min_wait=0.1, max_wait=1.0)
         async def test_func():
             return "success"
 
-        result = await test_func()
+        assert await test_func() == "success"
+
+
+class TestRetryBehavior:
+    """Test retry and backoff behavior without real sleeps."""
+
+    async def test_retry_storage_operation_with_retry(self, no_sleep):
+        """Test that transient failures are retried until success."""
+        func, calls = _failing(2)
+
+        result = await retry_storage_operation(
+            max_attempts=3, min_wait=0.1, max_wait=1.0
+        )(func)()
+
         assert result == "success"
+        assert len(calls) == 3
+        assert len(no_sleep) == 2
 
-    @pytest.mark.asyncio
-    async def test_create_retry_decorator_worker(self):
-        """Test creating worker retry decorator."""
-        decorator = create_retry_decorator(
-            "worker", max_attempts=3, min_wait=0.1, max_wait=1.0
-        )
+    async def test_retry_worker_operation_max_attempts(self, no_sleep):
+        """Test that the last error is re-raised once attempts run out."""
+        func, calls = _failing(5)
 
-        @decorator
-        async def test_func():
-            return "success"
+        with pytest.raises(ConnectionError, match="transient"):
+            await retry_worker_operation(max_attempts=3, min_wait=0.1, max_wait=1.0)(
+                func
+            )()
+
+        assert len(calls) == 3
+        assert len(no_sleep) == 2
+
+    async def test_retry_does_not_retry_application_errors(self, no_sleep):
+        """Test that non-transient errors fail on the first attempt."""
+        func, calls = _failing(1, exc_type=ValueError)
+
+        with pytest.raises(ValueError):
+            await retry_storage_operation(max_attempts=3, min_wait=0.1)(func)()
+
+        assert len(calls) == 1
+        assert no_sleep == []
+
+    @pytest.mark.parametrize(
+        "exc_type",
+        [ConnectionError, ConnectionResetError, TimeoutError, BrokenPipeError],
+    )
+    async def test_execute_with_retry_after_failures(self, no_sleep, exc_type):
+        """Test that each transient error type is retried by execute_with_retry."""
+        func, calls = _failing(1, exc_type=exc_type)
+
+        result = await execute_with_retry(
+            func, max_attempts=3, min_wait=0.1, max_wait=1.0
+        )
 
-        result = await test_func()
         assert result == "success"
+        assert len(calls) == 2
+        assert len(no_sleep) == 1
 
-    @pytest.mark.asyncio
-    async def test_create_retry_decorator_api(self):
-        """Test creating API retry decorator."""
-        decorator = create_retry_decorator(
-            "api", max_attempts=3, min_wait=0.1, max_wait=1.0
+
+class TestIsRetryableError:
+    """Test classification of retryable exceptions."""
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (_CONN_ERR, True),
+            (_TIMEOUT, True),
+            (_AIO_TIMEOUT, True),
+            (_BROKEN_PIPE, True),
+            (_VALUE_ERR, False),
+            (_KEY_ERR, False),
+        ],
+        ids=[
+            "connection",
+            "timeout",
+            "asyncio_timeout",
+            "broken_pipe",
+            "value",
+            "key",
+        ],
+    )
+    def test_is_retryable_error(self, error, expected):
+        """Test that only transient errors are classified as retryable."""
+        assert is_retryable_error(error) is expected
+
+    def test_retryable_tuple_is_minimal_and_complete(self):
+        """Test that the isinstance tuple holds only roots covering every type."""
+        assert all(
+            not issubclass(exc, other)
+            for exc in _RETRYABLE_EXCEPTIONS
+            for other in _RETRYABLE_EXCEPTIONS
+            if exc is not other
+        )
+        assert all(
+            issubclass(exc, _RETRYABLE_EXCEPTIONS) for exc in TRANSIENT_EXCEPTIONS
         )
 
-        @decorator
-        async def test_func(value):
-            return value * 2
+    def test_retryable_roots_come_from_transient_exceptions(self):
+        """Test that the reduced tuple adds no type of its own."""
+        assert set(_RETRYABLE_EXCEPTIONS) <= set(TRANSIENT_EXCEPTIONS)
+        # Every transient type is an OSError on supported Pythons
+        assert _RETRYABLE_EXCEPTIONS == (OSError,)
 
-        result = await test_func(21)
-        assert result == 42
+
+class TestRetryConfig:
+    """Test retry settings and how decorators fall back to them."""
+
+    @pytest.mark.parametrize(
+        ("operation_type", "expected"),
+        [
+            ("worker", (3, 1.0, 10.0)),
+            ("storage", (5, 0.5, 5.0)),
+            ("scheduler", (3, 1.0, 8.0)),
+            ("api", (4, 1.0, 15.0)),
+        ],
+    )
+    def test_operation_config(self, retry_cfg, operation_type, expected):
+        """Test the default attempts and wait bounds per operation type."""
+        assert (
+            getattr(retry_cfg, f"{operation_type}_max_attempts"),
+            getattr(retry_cfg, f"{operation_type}_min_wait"),
+            getattr(retry_cfg, f"{operation_type}_max_wait"),
+        ) == expected
+
+    async def test_decorator_defaults_to_settings(self, retry_cfg, no_sleep):
+        """Test that unset decorator arguments come from settings."""
+        func, calls = _failing(100)
+
+        with pytest.raises(ConnectionError):
+            await retry_storage_operation()(func)()
+
+        assert len(calls) == retry_cfg.storage_max_attempts
+        assert len(no_sleep) == retry_cfg.storage_max_attempts - 1
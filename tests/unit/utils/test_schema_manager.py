@@ -1,6 +1,5 @@
 """Comprehensive tests for schema_manager utilities."""
 
-import pytest
 from unittest.mock import AsyncMock, MagicMock
 
 from bindu.utils.schema_manager import (
@@ -83,7 +82,6 @@ class TestSanitizeDIDForSchema:
 class TestCreateSchemaIfNotExists:
     """Test schema creation functionality."""
 
-    @pytest.mark.asyncio
     async def test_create_new_schema(self):
         """Test creating a new schema that doesn't exist."""
         mock_conn = AsyncMock()
@@ -101,7 +99,6 @@ class TestCreateSchemaIfNotExists:
         assert mock_conn.execute.call_count == 2
         mock_conn.commit.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_schema_already_exists(self):
         """Test when schema already exists."""
         mock_conn = AsyncMock()
@@ -119,7 +116,6 @@ class TestCreateSchemaIfNotExists:
         assert mock_conn.execute.call_count == 1
         mock_conn.commit.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_create_schema_with_special_name(self):
         """Test creating schema with sanitized name."""
         mock_conn = AsyncMock()
@@ -144,7 +140,6 @@ class TestCreateSchemaIfNotExists:
 class TestSetSearchPath:
     """Test search_path configuration."""
 
-    @pytest.mark.asyncio
     async def test_set_search_path_single_schema(self):
         """Test setting search_path to a single schema."""
         mock_conn = AsyncMock()
@@ -157,7 +152,6 @@ class TestSetSearchPath:
         assert "test_schema" in sql_text
         assert "SET search_path" in sql_text
 
-    @pytest.mark.asyncio
     async def test_set_search_path_with_public(self):
         """Test setting search_path including public schema."""
         mock_conn = AsyncMock()
@@ -170,7 +164,6 @@ class TestSetSearchPath:
         assert "test_schema" in sql_text
         assert "public" in sql_text
 
-    @pytest.mark.asyncio
     async def test_set_search_path_without_public(self):
         """Test setting search_path without public schema."""
         mock_conn = AsyncMock()
@@ -188,7 +181,6 @@ class TestSetSearchPath:
 class TestInitializeDIDSchema:
     """Test complete DID schema initialization."""
 
-    @pytest.mark.asyncio
     async def test_initialize_new_schema_with_tables(self):
         """Test initializing a new schema with table creation."""
         mock_engine = MagicMock()
@@ -215,7 +207,6 @@ class TestInitializeDIDSchema:
         assert mock_engine.begin.call_count == 2
         mock_conn.run_sync.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_initialize_existing_schema_with_tables(self):
         """Test initializing an existing schema with table creation."""
         mock_engine = MagicMock()
@@ -239,7 +230,6 @@ class TestInitializeDIDSchema:
         # Should still create tables even if schema exists
         mock_conn.run_sync.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_initialize_schema_without_tables(self):
         """Test initializing schema without creating tables."""
         mock_engine = MagicMock()
@@ -264,7 +254,6 @@ class TestInitializeDIDSchema:
         # Should not call run_sync for table creation
         mock_conn.run_sync.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_initialize_schema_full_workflow(self):
         """Test full workflow with DID sanitization and schema creation."""
         mock_engine = MagicMock()
@@ -11,7 +11,6 @@ from bindu.utils.worker.tasks import TaskStateManager
 class TestTaskStateManager:
     """Test TaskStateManager functionality."""
 
-    @pytest.mark.asyncio
     async def test_validate_task_state_matches_expected(self):
         """Test validating task with matching state."""
         task = cast(
@@ -25,7 +24,6 @@ class TestTaskStateManager:
         # Should not raise when state matches expected
         await TaskStateManager.validate_task_state(task, expected_state="submitted")
 
-    @pytest.mark.asyncio
     async def test_validate_task_state_custom_expected(self):
         """Test validating task with custom expected state."""
         task = cast(
@@ -39,7 +37,6 @@ class TestTaskStateManager:
         # Should not raise when state matches custom expected
         await TaskStateManager.validate_task_state(task, expected_state="working")
 
-    @pytest.mark.asyncio
     async def test_validate_task_state_mismatch_raises(self):
         """Test validating task with mismatched state raises error."""
         task = cast(
@@ -1,6 +1,8 @@
 """Test utilities for creating test data and assertions."""
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, cast
 from uuid import UUID, uuid4
 
@@ -54,6 +56,12 @@ def create_test_message(
     return message
 
 
+# Shared read-only message for tests that pass one without inspecting it (e.g.
+# argument validation that fails first). Tests whose code under test mutates or
+# stores the message must still build their own with create_test_message().
+SAMPLE_MESSAGE: Mapping[str, Any] = MappingProxyType(create_test_message())
+
+
 def create_test_task(
     task_id: Optional[UUID] = None,
     context_id: Optional[UUID] = None,